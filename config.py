@@ -1,34 +1,64 @@
 # config.py
 import os
-from typing import Dict
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
-def get_config() -> Dict:
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Immutable configuration settings for the NCAA data collector.
+    
+    Frozen so one instance can be shared by the pipeline and every collector task;
+    use ``dataclasses.replace`` to derive a variant (e.g. a CLI override).
+    """
+    # API Keys (you'll need to get these from the respective services)
+    cfbd_api_key: Optional[str]
+    odds_api_key: Optional[str]
+    
+    # Redis Configuration
+    redis_host: str = 'localhost'
+    redis_port: int = 6379
+    cache_ttl_current: int = 6 * 3600  # seconds to cache current-season responses
+    # Completed seasons and games known to be final don't change; None never expires. Games not
+    # known to be final (partial stats) always get cache_ttl_current instead
+    cache_ttl_historical: Optional[int] = None
+    
+    # Data Collection Settings
+    current_season: int = 2024
+    seasons_to_collect: Tuple[int, ...] = (2020, 2021, 2022, 2023, 2024)
+    player_game_sample_weeks: Optional[int] = 5  # None collects every regular-season week
+    max_concurrency: int = 12
+    max_parallel_seasons: int = 2  # seasons collected at once in a full multi-season run
+    cfbd_requests_per_minute: int = 50
+    max_retries: int = 5
+    max_conns_per_host: int = 16
+    
+    # Output Settings
+    output_dir: str = 'data/raw/'
+    save_to_files: bool = True
+    io_workers: int = 2  # threads that write output files off the event loop
+    resume: bool = True  # skip completed-season files already listed in the output manifest
+    file_format: str = 'json'  # 'json', 'ndjson'/'jsonl', 'csv', 'parquet' or 'feather'
+    json_indent: bool = False  # pretty-print JSON output; compact is smaller and faster to write
+
+
+def get_config() -> Config:
     """
     Get configuration settings for the NCAA data collector.
     
     Returns:
-        Dict: Configuration dictionary with API keys and settings
+        Config: Configuration with API keys and settings, environment overrides applied
     """
-    config = {
-        # API Keys (you'll need to get these from the respective services)
-        'cfbd_api_key': os.getenv('CFBD_API_KEY', '8O0ClYn1Aw1thycgcxSKbemsHWvNSZMYhoyEkR4KZAHwrggwBYbDv6gXPKqbFcZs'),
-        'odds_api_key': os.getenv('ODDS_API_KEY', '883a632f23d80b2654519cd6edefa1e5'),
-        
-        # Redis Configuration
-        'redis_host': os.getenv('REDIS_HOST', 'localhost'),
-        'redis_port': int(os.getenv('REDIS_PORT', 6379)),
-        
-        # Data Collection Settings
-        'current_season': 2024,
-        'seasons_to_collect': [2020, 2021, 2022, 2023, 2024],
-        
-        # Output Settings
-        'output_dir': 'data/raw/',
-        'save_to_files': True,
-        'file_format': 'json'  # or 'csv'
-    }
-    
-    return config
+    return Config(
+        # Keys come from the environment only, so every user runs against their own quota
+        cfbd_api_key=os.getenv('CFBD_API_KEY'),
+        odds_api_key=os.getenv('ODDS_API_KEY'),
+        redis_host=os.getenv('REDIS_HOST', 'localhost'),
+        redis_port=int(os.getenv('REDIS_PORT', 6379)),
+        max_concurrency=int(os.getenv('MAX_CONCURRENCY', 12)),
+        cfbd_requests_per_minute=int(os.getenv('CFBD_REQUESTS_PER_MINUTE', 50)),
+    )
 
 # API Key Setup Instructions
 API_SETUP_INSTRUCTIONS = """
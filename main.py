@@ -1,15 +1,48 @@
 # main.py
+import argparse
 import asyncio
-import json
+import contextlib
+import dataclasses
+import functools
+import hashlib
 import os
 import logging
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sized, Tuple, Union
+
+import orjson
+
+# Optional tabular backends, only needed for the CSV, Parquet and Feather output formats
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Advisory file locks for the manifest shared by processes writing one output_dir (POSIX only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Optional libuv-based event loop; the stdlib loop is used when it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Import your collector and config
-from src.data_pipeline.collectors import NCAADataCollector
-from config import get_config, API_SETUP_INSTRUCTIONS
+from src.data_pipeline.collectors import (
+    REGULAR_SEASON_WEEKS, SEASON_BUNDLE_ENDPOINTS, NCAADataCollector, create_session
+)
+from config import Config, get_config, API_SETUP_INSTRUCTIONS
 
 # Setup logging
 logging.basicConfig(
@@ -23,71 +56,613 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Datetimes go through ``default=str`` so files keep the "YYYY-MM-DD HH:MM:SS+00:00" format;
+# non-str dict keys (e.g. int seasons) are stringified as the stdlib json module did
+JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+NDJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | JSON_OPTIONS
+# Encoded NDJSON is handed to the file in chunks of about this size instead of one big payload
+NDJSON_FLUSH_BYTES = 1 << 20
+# Buffer size for files written piecemeal (streamed weeks, pandas CSV rows); the 8 KiB default
+# turns a large dataset into thousands of small write syscalls
+WRITE_BUFFER_BYTES = 1 << 20
+
+# With --debug-loop, callbacks that hold the event loop longer than this (seconds) are logged
+SLOW_CALLBACK_SECONDS = 0.1
+
+# (summary report key, collected dataset key) for each per-season count in the summary
+SUMMARY_FIELDS = (
+    ('teams_count', 'teams'),
+    ('games_count', 'schedule'),
+    ('team_season_stats_count', 'team_season_stats'),
+    ('team_advanced_stats_count', 'team_advanced_stats'),
+    ('player_passing_stats_count', 'player_passing_stats'),
+    ('player_rushing_stats_count', 'player_rushing_stats'),
+    ('player_receiving_stats_count', 'player_receiving_stats'),
+    ('player_defensive_stats_count', 'player_defensive_stats'),
+    ('talent_ratings_count', 'talent_ratings'),
+    ('recruiting_count', 'recruiting'),
+    ('weekly_team_stats_count', 'weekly_team_stats'),
+    ('player_game_stats_count', 'player_game_stats_sample'),
+    ('betting_lines_count', 'betting_lines'),
+)
+
+# Records which datasets have already been written, so restarts can skip them
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def _ndjson_lines(records: Iterable[Any]) -> bytes:
+    """Encode records as newline-delimited JSON, one record per line."""
+    return b''.join(orjson.dumps(record, default=str, option=NDJSON_OPTIONS) for record in records)
+
+
+def _append_ndjson(f: BinaryIO, records: Iterable[Any]) -> None:
+    f.write(_ndjson_lines(records))
+
+
+def _write_json(data: Any, path: Path, option: int = JSON_OPTIONS) -> None:
+    payload = orjson.dumps(data, default=str, option=option)
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
+def _write_json_indented(data: Any, path: Path) -> None:
+    """Pretty-printed variant for files meant to be read by hand, like the collection summary."""
+    _write_json(data, path, option=JSON_OPTIONS | orjson.OPT_INDENT_2)
+
+
+def _write_ndjson(data: Any, path: Path) -> None:
+    """Encode one record per line, flushing every NDJSON_FLUSH_BYTES so memory stays bounded."""
+    buf = bytearray()
+    with open(path, 'wb') as f:
+        for record in (data if isinstance(data, list) else [data]):
+            buf += orjson.dumps(record, default=str, option=NDJSON_OPTIONS)
+            if len(buf) >= NDJSON_FLUSH_BYTES:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
+
+
+@functools.lru_cache(maxsize=None)
+def _pandas() -> Any:
+    """Import pandas on first use; only the CSV fallback needs it, so other runs skip the import."""
+    import pandas
+    return pandas
+
+
+def _records_to_arrow(records: List[Any]) -> 'pa.Table':
+    """Build an Arrow table from dict rows, or column by column from the collectors' dataclass rows."""
+    if records and dataclasses.is_dataclass(records[0]):
+        names = [field.name for field in dataclasses.fields(records[0])]
+        return pa.Table.from_pydict({name: [getattr(row, name) for row in records] for name in names})
+    return pa.Table.from_pylist(records)
+
+
+def _pandas_csv_values(table: 'pa.Table') -> 'pa.Table':
+    """
+    Render timestamp and boolean columns as pandas' to_csv writes them.
+    
+    Timestamps become "2024-09-05 16:00:00+00:00" (Arrow's own form is
+    "2024-09-05 16:00:00.000000Z") and booleans True/False (Arrow writes true/false),
+    so these columns read the same whichever of _write_csv's two writers produced the
+    file. Values with sub-second precision make the cast to seconds raise ArrowInvalid,
+    which leaves the file to the pandas writer.
+    """
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if pa.types.is_boolean(field.type):
+            text = pc.if_else(column, 'True', 'False')
+        elif pa.types.is_timestamp(field.type):
+            column = column.cast(pa.timestamp('s', tz=field.type.tz))
+            if field.type.tz is None:
+                text = pc.strftime(column, format='%Y-%m-%d %H:%M:%S')
+            else:
+                # %z gives "+0000"; pandas writes the offset as "+00:00"
+                text = pc.replace_substring_regex(
+                    pc.strftime(column, format='%Y-%m-%d %H:%M:%S%z'), pattern=r'(\d\d)$', replacement=r':\1'
+                )
+        else:
+            continue
+        table = table.set_column(i, field.name, text)
+    return table
+
+
+def _write_csv(data: Any, path: Path) -> None:
+    """
+    Write records with Arrow's native CSV writer, falling back to pandas for nested values.
+    
+    Arrow's CSV dialect isn't byte-for-byte pandas': every string value is quoted, and an
+    integer column with missing values keeps its integers ("21") where pandas writes
+    floats ("21.0"). Timestamps and booleans are converted to pandas' spelling.
+    """
+    if not isinstance(data, list):
+        raise ValueError(f"Cannot save non-list data as CSV: {path.name}")
+    
+    if pa is not None:
+        try:
+            table = _pandas_csv_values(_records_to_arrow(data))
+            pacsv.write_csv(table, str(path), write_options=pacsv.WriteOptions(batch_size=8192))
+            return
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+            # Mixed-type or list-valued columns (e.g. team logos) aren't CSV-encodable in Arrow
+            logger.debug(f"Arrow CSV writer unavailable for {path}, using pandas: {e}")
+    
+    with open(path, 'w', newline='', buffering=WRITE_BUFFER_BYTES) as f:
+        _pandas().DataFrame(data).to_csv(f, index=False, chunksize=50_000)
+
+
+def _arrow_table(data: Any, path: Path) -> 'pa.Table':
+    """Convert a list of records to an Arrow table, raising ValueError when that isn't possible."""
+    if not isinstance(data, list):
+        raise ValueError(f"Cannot save non-list data as a columnar file: {path.name}")
+    
+    try:
+        return _records_to_arrow(data)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # e.g. a column mixing numbers and strings, like an attendance of 'N/A'
+        raise ValueError(f"Cannot build an Arrow table for {path.name}: {e}") from e
+
+
+def _write_parquet(data: Any, path: Path) -> None:
+    """Write records as a zstd-compressed Parquet table; repeated strings are dictionary-encoded."""
+    pq.write_table(_arrow_table(data, path), path, compression='zstd', use_dictionary=True)
+
+
+def _write_feather(data: Any, path: Path) -> None:
+    """Write records as an lz4-compressed Feather (Arrow IPC) file, the fastest to load back."""
+    feather.write_feather(_arrow_table(data, path), path, compression='lz4')
+
+
+def _encode_with_digest(encode: Callable[[Any], bytes], data: Any) -> Tuple[bytes, str]:
+    """Serialize data and fingerprint the bytes, so unchanged saves can be detected."""
+    payload = encode(data)
+    return payload, hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _replace_file(path: Path, payload: bytes) -> None:
+    """Write payload next to path, then atomically swap it into place."""
+    # Unique per write, so processes (or tasks) saving the same file never share a temp file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    return orjson.loads(path.read_bytes()) if path.exists() else {}
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on path; a no-op where fcntl isn't available."""
+    with open(path, 'ab') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _merge_manifest(
+    path: Path, entries: Dict[str, Dict[str, Any]], removed: Iterable[str] = ()
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge entries into (and drop removed names from) the manifest on disk and return the result.
+    
+    The file is re-read under a lock, so pipelines in several processes sharing one
+    output_dir (e.g. a backfill split by season) add to each other's entries instead of
+    overwriting them with their own in-memory copy.
+    """
+    with _file_lock(path.with_name(f"{path.name}.lock")):
+        manifest = _read_manifest(path)
+        manifest.update(entries)
+        for filename in removed:
+            manifest.pop(filename, None)
+        _replace_file(path, orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    return manifest
+
+
+def _read_json(path: Path) -> Any:
+    return orjson.loads(path.read_bytes())
+
+
+def _read_csv(path: Path) -> List[Dict]:
+    if pa is not None:
+        return pacsv.read_csv(path).to_pylist()
+    return _pandas().read_csv(path).to_dict('records')
+
+
+def _read_parquet(path: Path) -> List[Dict]:
+    return pq.read_table(path).to_pylist()
+
+
+def _read_feather(path: Path) -> List[Dict]:
+    return feather.read_table(path).to_pylist()
+
+
+# file_format -> (file extension, writer); resolved once when the pipeline is built
+FILE_WRITERS: Dict[str, Tuple[str, Callable[[Any, Path], None]]] = {
+    'json': ('.json', _write_json),
+    'ndjson': ('.ndjson', _write_ndjson),
+    'jsonl': ('.jsonl', _write_ndjson),
+    'csv': ('.csv', _write_csv),
+    'parquet': ('.parquet', _write_parquet),
+    'feather': ('.feather', _write_feather),
+}
+
+# file_format -> reader loading a saved dataset back for resumed runs; line-delimited
+# formats are instead re-read lazily through StreamedRecords
+FILE_READERS: Dict[str, Callable[[Path], Any]] = {
+    'json': _read_json,
+    'csv': _read_csv,
+    'parquet': _read_parquet,
+    'feather': _read_feather,
+}
+
+# Line-delimited formats whose weekly datasets can be streamed to disk as weeks land
+STREAMING_FORMATS = ('ndjson', 'jsonl')
+
+# Formats with no fallback when pyarrow is missing
+ARROW_FORMATS = ('parquet', 'feather')
+
+
+class StreamedRecords:
+    """
+    A dataset that was streamed to a line-delimited file instead of being kept in memory.
+    
+    ``len()`` is the record count tallied while writing; iterating decodes the file
+    lazily, one record per line.
+    """
+    
+    def __init__(self, path: Path, count: int):
+        self.path = path
+        self.count = count
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __iter__(self) -> Iterator[Dict]:
+        with open(self.path, 'rb') as f:
+            for line in f:
+                yield orjson.loads(line)
+
+
 class DataIngestionPipeline:
     """Main pipeline for ingesting NCAA football data."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Config):
         self.config = config
-        self.collector = NCAADataCollector(config)
-        self.output_dir = Path(config['output_dir'])
+        # Read on every dataset, so hoisted out of the config once
+        self._save_to_files = config.save_to_files
+        try:
+            self._file_ext, self._write = FILE_WRITERS[config.file_format]
+        except KeyError:
+            raise ValueError(f"Unsupported file_format: {config.file_format!r}") from None
+        if config.file_format in ARROW_FORMATS and pa is None:
+            raise ValueError(f"file_format {config.file_format!r} requires pyarrow")
+        # JSON is encoded up front so a payload identical to the last save can skip the write
+        self._encode: Optional[Callable[[Any], bytes]] = None
+        if config.file_format == 'json':
+            option = JSON_OPTIONS | orjson.OPT_INDENT_2 if config.json_indent else JSON_OPTIONS
+            self._encode = functools.partial(orjson.dumps, default=str, option=option)
+        # One keep-alive session for the whole run so TLS handshakes are paid once per connection
+        self.session = create_session(config)
+        self.collector = NCAADataCollector(config, session=self.session)
+        self.output_dir = Path(config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Caps the number of in-flight collector requests across fan-outs
+        self.semaphore = asyncio.Semaphore(config.max_concurrency)
+        # season -> dataset key -> record count, tallied as each dataset lands
+        self.record_counts: Dict[int, Dict[str, int]] = defaultdict(dict)
+        # filename -> {'file', 'count', 'saved_at'[, 'digest']} for every dataset written so far
+        self.manifest_path = self.output_dir / MANIFEST_FILENAME
+        self.manifest: Dict[str, Dict[str, Any]] = _read_manifest(self.manifest_path)
+        self._manifest_lock = asyncio.Lock()
+        # Dedicated file-writing threads: keeps blocking I/O off the event loop and caps
+        # concurrent writes so they don't compete with the default executor
+        self._io_pool = ThreadPoolExecutor(max_workers=config.io_workers, thread_name_prefix='ncaa-io')
+    
+    async def __aenter__(self) -> 'DataIngestionPipeline':
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
     
-    def save_data(self, data: Any, filename: str) -> None:
-        """Save data to file in specified format."""
+    async def close(self) -> None:
+        """Release the shared HTTP session, its pooled connections and the writer threads."""
+        await self.collector.close()
+        await self.session.close()
+        self._io_pool.shutdown(wait=True)
+    
+    async def _run_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking file operation on the dedicated I/O threads."""
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, func, *args)
+    
+    async def save_data(self, data: Any, filename: str) -> None:
+        """
+        Save data to file in specified format without blocking the event loop.
+        
+        Data the format can't represent (a writer raising ValueError) is logged and
+        left unsaved and out of the manifest, so a later run collects it again.
+        """
         if not data:
             logger.warning(f"No data to save for {filename}")
             return
         
-        file_path = self.output_dir / filename
+        file_path = self.output_dir / f"{filename}{self._file_ext}"
+        count = len(data) if isinstance(data, list) else 1
+        digest = None
+        if self._encode is None:
+            try:
+                await self._run_io(self._write, data, file_path)
+            except ValueError as e:
+                logger.error(f"Could not save {filename}: {e}")
+                return
+        else:
+            payload, digest = await self._run_io(_encode_with_digest, self._encode, data)
+            entry = self.manifest.get(filename)
+            if entry is not None and entry.get('digest') == digest and file_path.exists():
+                logger.info(f"Unchanged {filename} ({count} records), skipping write")
+                return
+            await self._run_io(_replace_file, file_path, payload)
+        await self._mark_saved(filename, count, digest)
+        
+        logger.info(f"Saved {filename} with {count} records")
+    
+    async def _mark_saved(self, filename: str, count: int, digest: Optional[str] = None) -> None:
+        """
+        Record a finished file (and its content digest, when known) in the manifest and persist it atomically.
+        
+        The entry is merged into the manifest as it is on disk, which also picks up entries
+        saved meanwhile by other processes sharing the output_dir.
+        """
+        entry = {
+            'file': f"{filename}{self._file_ext}",
+            'count': count,
+            'saved_at': datetime.now().isoformat()
+        }
+        if digest is not None:
+            entry['digest'] = digest
+        async with self._manifest_lock:
+            self.manifest = await self._run_io(_merge_manifest, self.manifest_path, {filename: entry})
+    
+    async def _unmark_saved(self, filename: str) -> None:
+        """Drop a file from the manifest, so a later run collects it again instead of resuming it."""
+        async with self._manifest_lock:
+            self.manifest = await self._run_io(_merge_manifest, self.manifest_path, {}, (filename,))
+    
+    def _resumed(self, season: int, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the manifest entry of a completed season's dataset already on disk from an earlier run.
+        
+        The current season is always re-collected since its data still changes.
+        """
+        if not (self.config.resume and self._save_to_files):
+            return None
+        if season >= self.config.current_season:
+            return None
+        
+        entry = self.manifest.get(filename)
+        if entry is None or not (self.output_dir / entry['file']).exists():
+            return None
+        if not entry['file'].endswith(self._file_ext):
+            return None
+        return entry
+    
+    async def _load_resumed(self, collected_data: Dict[str, Any], season: int, key: str, filename: str) -> bool:
+        """
+        Load a dataset saved by an earlier run into collected_data instead of fetching it again.
+        
+        Resumed datasets come back as the plain records read from the file (a lazy
+        StreamedRecords for line-delimited formats) rather than the collector's row types.
+        Returns False when there is nothing to resume (or the saved file can't be read back),
+        in which case the caller collects the dataset as usual.
+        """
+        entry = self._resumed(season, filename)
+        if entry is None:
+            return False
+        
+        path = self.output_dir / entry['file']
+        if self.config.file_format in STREAMING_FORMATS:
+            records = StreamedRecords(path, entry['count'])
+        else:
+            try:
+                records = await self._run_io(FILE_READERS[self.config.file_format], path)
+            except Exception as e:
+                logger.warning(f"Could not load saved {filename}, collecting it again: {e}")
+                return False
+        
+        logger.info(f"Resumed {filename}: loaded {entry['count']} records saved earlier")
+        self._record(collected_data, season, key, records)
+        return True
+    
+    def _record(self, collected_data: Dict[str, Any], season: int, key: str, records: Sized) -> None:
+        """Store a collected dataset and tally its size for the summary report."""
+        collected_data[key] = records
+        self.record_counts[season][key] = len(records)
+    
+    async def _bounded(self, coro: Awaitable[Any]) -> Any:
+        """Await a collector call while holding the shared concurrency semaphore."""
+        async with self.semaphore:
+            return await coro
+    
+    async def _ndjson_writer(self, queue: asyncio.Queue, file_path: Path) -> None:
+        """
+        Single consumer that appends batches of records as NDJSON until a None sentinel.
+        
+        Encoding happens on the I/O threads together with the write, so serializing one
+        week overlaps with the HTTP fetches still in flight instead of running on the loop.
+        """
+        f = await self._run_io(functools.partial(open, file_path, 'wb', buffering=WRITE_BUFFER_BYTES))
+        try:
+            while (records := await queue.get()) is not None:
+                await self._run_io(_append_ndjson, f, records)
+        finally:
+            await self._run_io(f.close)
+    
+    async def _collect_weekly(
+        self,
+        fetch: Callable[[int, int], Awaitable[List[Dict]]],
+        season: int,
+        weeks: Iterable[int],
+        filename: str
+    ) -> Union[List[Dict], 'StreamedRecords']:
+        """
+        Fetch several weeks concurrently, save them, and flatten the results in week order.
+        
+        With a line-delimited file format (``ndjson``/``jsonl``) each week is written to disk as soon as it
+        arrives and then released, so memory doesn't grow with the season; the records come back as
+        a ``StreamedRecords`` that re-reads the file on iteration.
+        
+        A dataset where any week raised (or that came back empty) is returned but not recorded
+        as saved, so a resumed run fetches it again rather than reusing a truncated file.
+        """
+        weeks = list(weeks)
+        save = self._save_to_files
+        queue = None
+        if save and self.config.file_format in STREAMING_FORMATS:
+            queue = asyncio.Queue()
+            writer = asyncio.create_task(
+                self._ndjson_writer(queue, self.output_dir / f"{filename}{self._file_ext}")
+            )
+        
+        async def fetch_week(week: int) -> Union[List[Dict], int]:
+            week_records = await self._bounded(fetch(season, week))
+            if queue is None:
+                return week_records
+            # Streamed weeks are handed to the writer and dropped; only their size is kept
+            if week_records:
+                await queue.put(week_records)
+            return len(week_records or ())
+        
+        try:
+            results = await asyncio.gather(
+                *(fetch_week(week) for week in weeks),
+                return_exceptions=True
+            )
+        finally:
+            if queue is not None:
+                await queue.put(None)
+                await writer
+        
+        failed = 0
+        for week, result in zip(weeks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error collecting week {week} of {season}: {result}")
+                failed += 1
+        
+        if queue is not None:
+            count = sum(result for result in results if not isinstance(result, Exception))
+            if count and not failed:
+                await self._mark_saved(filename, count)
+                logger.info(f"Streamed {filename} with {count} records")
+            else:
+                # The file on disk was overwritten with what did arrive; forget any earlier entry for it
+                await self._unmark_saved(filename)
+                logger.warning(f"Not marking {filename} saved: {failed}/{len(weeks)} weeks failed, {count} records")
+            return StreamedRecords(self.output_dir / f"{filename}{self._file_ext}", count)
+        
+        records = []
+        for result in results:
+            if result and not isinstance(result, Exception):
+                records.extend(result)
+        if save:
+            if failed:
+                logger.warning(f"Not saving {filename}: {failed}/{len(weeks)} weeks failed")
+            else:
+                await self.save_data(records, filename)
+        return records
+    
+    async def _collect_dataset(
+        self,
+        collected_data: Dict[str, Any],
+        season: int,
+        key: str,
+        filename: str,
+        fetch: Callable[..., Awaitable[List[Dict]]],
+        *args: Any,
+        weeks: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Fetch, record and save one dataset unless an earlier run already saved it.
+        
+        Passing ``weeks`` fans ``fetch(season, week)`` out through ``_collect_weekly``;
+        otherwise ``fetch(*args)`` is awaited under the shared semaphore. Errors are
+        logged here so one failing endpoint doesn't cancel its siblings in a gather.
+        """
+        if await self._load_resumed(collected_data, season, key, filename):
+            return
         
-        if self.config['file_format'] == 'json':
-            with open(f"{file_path}.json", 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-        elif self.config['file_format'] == 'csv':
-            import pandas as pd
-            if isinstance(data, list):
-                df = pd.DataFrame(data)
-                df.to_csv(f"{file_path}.csv", index=False)
+        logger.info(f"Collecting {key} for {season}...")
+        try:
+            if weeks is not None:
+                records = await self._collect_weekly(fetch, season, weeks, filename)
             else:
-                logger.error(f"Cannot save non-list data as CSV: {filename}")
+                records = await self._bounded(fetch(*args))
+                if self._save_to_files:
+                    await self.save_data(records, filename)
+        except Exception as e:
+            logger.error(f"Error collecting {filename}: {e}")
+            return
+        
+        self._record(collected_data, season, key, records)
+    
+    async def _collect_season_bundle(self, collected_data: Dict[str, Any], season: int) -> None:
+        """Fetch the season-level team datasets in one batch, then record and save each like a dataset."""
+        resumed = await asyncio.gather(*(
+            self._load_resumed(collected_data, season, key, f"{key}_{season}") for key in SEASON_BUNDLE_ENDPOINTS
+        ))
+        keys = [key for key, done in zip(SEASON_BUNDLE_ENDPOINTS, resumed) if not done]
+        if not keys:
+            return
         
-        logger.info(f"Saved {filename} with {len(data) if isinstance(data, list) else 1} records")
+        logger.info(f"Collecting {', '.join(keys)} for {season}...")
+        try:
+            bundle = await self._bounded(self.collector.collect_season_bundle(season, keys))
+        except Exception as e:
+            logger.error(f"Error collecting season bundle for {season}: {e}")
+            return
+        
+        for key, records in bundle.items():
+            self._record(collected_data, season, key, records)
+        if self._save_to_files:
+            await asyncio.gather(*(self.save_data(records, f"{key}_{season}") for key, records in bundle.items()))
     
-    async def collect_all_data(self, season: int) -> Dict[str, Any]:
-        """Collect basic data for a given season."""
+    async def collect_all_data(self, season: int, teams: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """Collect basic data for a given season, reusing ``teams`` when provided."""
         logger.info(f"Starting basic data collection for {season} season...")
         
         collected_data = {}
         
         try:
-            # 1. Collect teams data
-            logger.info("Collecting teams data...")
-            teams = await self.collector.collect_teams_data()
-            collected_data['teams'] = teams
-            if self.config['save_to_files']:
-                self.save_data(teams, f"teams_{season}")
+            # Independent endpoints, so every dataset is fetched and saved concurrently
+            datasets = [
+                # 1. Schedule data
+                self._collect_dataset(collected_data, season, 'schedule', f"schedule_{season}",
+                                      self.collector.collect_schedule, season),
+                # 2. Basic team season stats
+                self._collect_dataset(collected_data, season, 'team_season_stats', f"team_season_stats_{season}",
+                                      self.collector.collect_team_season_stats, season),
+            ]
             
-            # 2. Collect schedule data
-            logger.info(f"Collecting schedule for {season}...")
-            schedule = await self.collector.collect_schedule(season)
-            collected_data['schedule'] = schedule
-            if self.config['save_to_files']:
-                self.save_data(schedule, f"schedule_{season}")
+            # 3. Teams data (skipped when the caller already fetched it)
+            if teams is not None:
+                self._record(collected_data, season, 'teams', teams)
+            else:
+                datasets.append(self._collect_dataset(collected_data, season, 'teams', f"teams_{season}",
+                                                      self.collector.collect_teams_data))
             
-            # 3. Collect basic team season stats
-            logger.info("Collecting team season statistics...")
-            team_stats = await self.collector.collect_team_season_stats(season)
-            collected_data['team_season_stats'] = team_stats
-            if self.config['save_to_files']:
-                self.save_data(team_stats, f"team_season_stats_{season}")
+            # 4. Betting lines (current season only)
+            if season == self.config.current_season:
+                datasets.append(self._collect_dataset(collected_data, season, 'betting_lines', f"betting_lines_{season}",
+                                                      self.collector.collect_betting_lines, season))
             
-            # 4. Collect betting lines (current season only)
-            if season == self.config['current_season']:
-                logger.info("Collecting betting lines...")
-                betting_lines = await self.collector.collect_betting_lines(season)
-                collected_data['betting_lines'] = betting_lines
-                if self.config['save_to_files']:
-                    self.save_data(betting_lines, f"betting_lines_{season}")
+            await asyncio.gather(*datasets)
             
             logger.info(f"Basic data collection completed for {season}")
             return collected_data
@@ -96,92 +671,45 @@ class DataIngestionPipeline:
             logger.error(f"Error collecting basic data for {season}: {e}")
             return collected_data
     
-    async def collect_comprehensive_data(self, season: int) -> Dict[str, Any]:
-        """Collect comprehensive data including detailed player and team stats."""
+    async def collect_comprehensive_data(self, season: int, teams: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """Collect comprehensive data including detailed player and team stats, reusing ``teams`` when provided."""
         logger.info(f"Starting comprehensive data collection for {season} season...")
         
         collected_data = {}
         
         try:
-            # 1. Basic team info
-            logger.info("Collecting teams data...")
-            teams = await self.collector.collect_teams_data()
-            collected_data['teams'] = teams
-            if self.config['save_to_files']:
-                self.save_data(teams, f"teams_{season}")
-            
-            # 2. Game schedule
-            logger.info(f"Collecting schedule for {season}...")
-            schedule = await self.collector.collect_schedule(season)
-            collected_data['schedule'] = schedule
-            if self.config['save_to_files']:
-                self.save_data(schedule, f"schedule_{season}")
-            
-            # 3. Team season statistics (comprehensive)
-            logger.info("Collecting team season statistics...")
-            team_stats = await self.collector.collect_team_season_stats(season)
-            collected_data['team_season_stats'] = team_stats
-            if self.config['save_to_files']:
-                self.save_data(team_stats, f"team_season_stats_{season}")
+            # Independent endpoints, so every dataset is fetched and saved concurrently
+            datasets = [
+                # 1. Game schedule
+                self._collect_dataset(collected_data, season, 'schedule', f"schedule_{season}",
+                                      self.collector.collect_schedule, season),
+                # 2-5. Team season, advanced, talent and recruiting data (one batched cache lookup)
+                self._collect_season_bundle(collected_data, season),
+                # 6. Team game statistics (regular season weeks)
+                self._collect_dataset(collected_data, season, 'weekly_team_stats', f"weekly_team_stats_{season}",
+                                      self.collector.collect_team_game_stats, weeks=REGULAR_SEASON_WEEKS),
+                # 7. Player game statistics (first N weeks; a None sample size takes the whole season)
+                self._collect_dataset(collected_data, season, 'player_game_stats_sample',
+                                      f"player_game_stats_sample_{season}", self.collector.collect_player_game_stats,
+                                      weeks=REGULAR_SEASON_WEEKS[:self.config.player_game_sample_weeks]),
+            ]
             
-            # 4. Advanced team statistics
-            logger.info("Collecting advanced team statistics...")
-            advanced_stats = await self.collector.collect_team_advanced_season_stats(season)
-            collected_data['team_advanced_stats'] = advanced_stats
-            if self.config['save_to_files']:
-                self.save_data(advanced_stats, f"team_advanced_stats_{season}")
-            
-            # 5. Player season statistics by category
+            # 8. Player season statistics by category
             player_categories = ['passing', 'rushing', 'receiving', 'defensive']
             for category in player_categories:
-                logger.info(f"Collecting {category} player statistics...")
-                player_stats = await self.collector.collect_player_season_stats(season, category)
-                collected_data[f'player_{category}_stats'] = player_stats
-                if self.config['save_to_files']:
-                    self.save_data(player_stats, f"player_{category}_stats_{season}")
-                await asyncio.sleep(1)  # Rate limiting
-            
-            # 6. Team talent ratings
-            logger.info("Collecting team talent ratings...")
-            talent_ratings = await self.collector.collect_team_talent_ratings(season)
-            collected_data['talent_ratings'] = talent_ratings
-            if self.config['save_to_files']:
-                self.save_data(talent_ratings, f"talent_ratings_{season}")
-            
-            # 7. Recruiting data
-            logger.info("Collecting recruiting data...")
-            recruiting = await self.collector.collect_recruiting_data(season)
-            collected_data['recruiting'] = recruiting
-            if self.config['save_to_files']:
-                self.save_data(recruiting, f"recruiting_{season}")
-            
-            # 8. Team game statistics (week by week)
-            logger.info("Collecting weekly team game stats...")
-            weekly_team_stats = []
-            for week in range(1, 16):  # Regular season weeks
-                logger.info(f"Collecting week {week} team stats...")
-                week_stats = await self.collector.collect_team_game_stats(season, week)
-                if week_stats:
-                    weekly_team_stats.extend(week_stats)
-                await asyncio.sleep(0.5)
+                datasets.append(self._collect_dataset(
+                    collected_data, season, f'player_{category}_stats', f"player_{category}_stats_{season}",
+                    self.collector.collect_player_season_stats, season, category
+                ))
             
-            collected_data['weekly_team_stats'] = weekly_team_stats
-            if self.config['save_to_files']:
-                self.save_data(weekly_team_stats, f"weekly_team_stats_{season}")
-            
-            # 9. Player game statistics (sample - first 5 weeks)
-            logger.info("Collecting sample player game stats...")
-            player_game_stats = []
-            for week in range(1, 6):  # Just first 5 weeks as sample
-                logger.info(f"Collecting week {week} player game stats...")
-                week_player_stats = await self.collector.collect_player_game_stats(season, week)
-                if week_player_stats:
-                    player_game_stats.extend(week_player_stats)
-                await asyncio.sleep(1)
+            # 9. Basic team info (skipped when the caller already fetched it)
+            if teams is not None:
+                self._record(collected_data, season, 'teams', teams)
+            else:
+                datasets.append(self._collect_dataset(collected_data, season, 'teams', f"teams_{season}",
+                                                      self.collector.collect_teams_data))
             
-            collected_data['player_game_stats_sample'] = player_game_stats
-            if self.config['save_to_files']:
-                self.save_data(player_game_stats, f"player_game_stats_sample_{season}")
+            await asyncio.gather(*datasets)
             
             logger.info(f"Comprehensive data collection completed for {season}")
             return collected_data
@@ -200,13 +728,14 @@ class DataIngestionPipeline:
             # Collect all player stats categories
             player_categories = ['passing', 'rushing', 'receiving', 'defensive', 'kicking', 'punting', 'kickReturns', 'puntReturns', 'interceptions']
             
-            for category in player_categories:
-                logger.info(f"Collecting {category} player statistics...")
-                player_stats = await self.collector.collect_player_season_stats(season, category)
-                collected_data[f'player_{category}_stats'] = player_stats
-                if self.config['save_to_files']:
-                    self.save_data(player_stats, f"player_{category}_stats_{season}")
-                await asyncio.sleep(1)  # Rate limiting
+            # Categories are independent, so fetch them concurrently under the shared semaphore
+            await asyncio.gather(*(
+                self._collect_dataset(
+                    collected_data, season, f'player_{category}_stats', f"player_{category}_stats_{season}",
+                    self.collector.collect_player_season_stats, season, category
+                )
+                for category in player_categories
+            ))
             
             logger.info(f"Player stats collection completed for {season}")
             return collected_data
@@ -222,33 +751,17 @@ class DataIngestionPipeline:
         collected_data = {}
         
         try:
-            # 1. Team game statistics (all weeks)
-            logger.info("Collecting detailed team game stats...")
-            weekly_team_stats = []
-            for week in range(1, max_weeks + 1):
-                logger.info(f"Collecting week {week} team stats...")
-                week_stats = await self.collector.collect_team_game_stats(season, week)
-                if week_stats:
-                    weekly_team_stats.extend(week_stats)
-                await asyncio.sleep(0.5)
-            
-            collected_data['weekly_team_stats'] = weekly_team_stats
-            if self.config['save_to_files']:
-                self.save_data(weekly_team_stats, f"detailed_weekly_team_stats_{season}")
-            
-            # 2. Player game statistics (all weeks - WARNING: This is A LOT of data)
-            logger.info("Collecting detailed player game stats...")
-            player_game_stats = []
-            for week in range(1, max_weeks + 1):
-                logger.info(f"Collecting week {week} player game stats...")
-                week_player_stats = await self.collector.collect_player_game_stats(season, week)
-                if week_player_stats:
-                    player_game_stats.extend(week_player_stats)
-                await asyncio.sleep(1)
-            
-            collected_data['player_game_stats'] = player_game_stats
-            if self.config['save_to_files']:
-                self.save_data(player_game_stats, f"detailed_player_game_stats_{season}")
+            weeks = range(1, max_weeks + 1)
+            await asyncio.gather(
+                # 1. Team game statistics (all weeks)
+                self._collect_dataset(collected_data, season, 'weekly_team_stats',
+                                      f"detailed_weekly_team_stats_{season}",
+                                      self.collector.collect_team_game_stats, weeks=weeks),
+                # 2. Player game statistics (all weeks - WARNING: This is A LOT of data)
+                self._collect_dataset(collected_data, season, 'player_game_stats',
+                                      f"detailed_player_game_stats_{season}",
+                                      self.collector.collect_player_game_stats, weeks=weeks)
+            )
             
             logger.info(f"Detailed game data collection completed for {season}")
             return collected_data
@@ -261,68 +774,74 @@ class DataIngestionPipeline:
         """Run the complete data ingestion pipeline for all configured seasons."""
         logger.info("Starting full data ingestion pipeline...")
         
-        all_collected_data = {}
+        # Teams don't vary by season, so fetch and save them once for the whole run
+        logger.info("Collecting teams data...")
+        teams = await self.collector.collect_teams_data()
+        if self._save_to_files:
+            await self.save_data(teams, "teams")
         
-        # Collect data for each specified season
-        for season in self.config['seasons_to_collect']:
-            season_data = await self.collect_comprehensive_data(season)
-            all_collected_data[season] = season_data
-            
-            # Add delay between seasons to be respectful to APIs
-            await asyncio.sleep(2)
+        # Collect a few seasons at a time; the shared semaphore keeps the total number of
+        # in-flight API requests bounded, while the season cap limits how much is held in memory
+        seasons = self.config.seasons_to_collect
+        season_slots = asyncio.Semaphore(self.config.max_parallel_seasons)
+        
+        async def collect_season(season: int) -> Dict[str, Any]:
+            async with season_slots:
+                return await self.collect_comprehensive_data(season, teams=teams)
+        
+        results = await asyncio.gather(
+            *(collect_season(season) for season in seasons),
+            return_exceptions=True
+        )
+        all_collected_data = {}
+        for season, result in zip(seasons, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error collecting season {season}: {result}")
+            else:
+                all_collected_data[season] = result
         
-        # Save summary report
+        # Save summary report; it's nested metadata, so always JSON whatever the file_format
         summary = self.generate_summary_report(all_collected_data)
-        self.save_data(summary, "collection_summary")
+        await self._run_io(_write_json_indented, summary, self.output_dir / "collection_summary.json")
+        logger.info("Saved collection_summary")
         
         logger.info("Full data ingestion pipeline completed!")
     
     def generate_summary_report(self, data: Dict) -> Dict:
-        """Generate a summary report of collected data."""
-        summary = {
+        """Generate a summary report of collected data from the counts recorded during collection."""
+        return {
             'collection_timestamp': datetime.now().isoformat(),
             'seasons_collected': list(data.keys()),
-            'summary_by_season': {}
+            # JSON object keys are strings; spelled out so the file never depends on encoder options
+            'summary_by_season': {str(season): self._season_summary(season) for season in data}
         }
-        
-        for season, season_data in data.items():
-            season_summary = {
-                'teams_count': len(season_data.get('teams', [])),
-                'games_count': len(season_data.get('schedule', [])),
-                'team_season_stats_count': len(season_data.get('team_season_stats', [])),
-                'team_advanced_stats_count': len(season_data.get('team_advanced_stats', [])),
-                'player_passing_stats_count': len(season_data.get('player_passing_stats', [])),
-                'player_rushing_stats_count': len(season_data.get('player_rushing_stats', [])),
-                'player_receiving_stats_count': len(season_data.get('player_receiving_stats', [])),
-                'player_defensive_stats_count': len(season_data.get('player_defensive_stats', [])),
-                'talent_ratings_count': len(season_data.get('talent_ratings', [])),
-                'recruiting_count': len(season_data.get('recruiting', [])),
-                'weekly_team_stats_count': len(season_data.get('weekly_team_stats', [])),
-                'player_game_stats_count': len(season_data.get('player_game_stats_sample', [])),
-                'betting_lines_count': len(season_data.get('betting_lines', []))
-            }
-            summary['summary_by_season'][season] = season_summary
-        
-        return summary
+    
+    def _season_summary(self, season: int) -> Dict[str, int]:
+        """Per-dataset record counts for one season, plus their total for capacity planning."""
+        counts = self.record_counts.get(season, {})
+        season_summary = {summary_key: counts.get(data_key, 0) for summary_key, data_key in SUMMARY_FIELDS}
+        season_summary['total_records'] = sum(counts.values())
+        return season_summary
 
 def check_prerequisites() -> bool:
     """Check if all prerequisites are met."""
     config = get_config()
     
     # Check API keys
-    if config['cfbd_api_key'] == 'your_cfbd_api_key_here':
-        print("❌ CFBD API key not configured")
+    if not config.cfbd_api_key:
+        print("❌ CFBD API key not configured (set CFBD_API_KEY)")
         print(API_SETUP_INSTRUCTIONS)
         return False
     
-    if config['odds_api_key'] == 'your_odds_api_key_here':
-        print("⚠️  Odds API key not configured (optional for most collections)")
+    if not config.odds_api_key:
+        print("⚠️  Odds API key not configured (optional for most collections; set ODDS_API_KEY)")
     
     # Check Redis connection
     try:
         import redis
-        r = redis.Redis(host=config['redis_host'], port=config['redis_port'])
-        r.ping()
+        # One-off sync ping before the event loop starts; the collector opens its own async pool
+        with redis.Redis(host=config.redis_host, port=config.redis_port) as r:
+            r.ping()
         print("✅ Redis connection successful")
     except Exception as e:
         print(f"❌ Redis connection failed: {e}")
@@ -332,24 +851,108 @@ def check_prerequisites() -> bool:
     print("✅ Prerequisites check completed!")
     return True
 
-async def main():
-    """Main entry point for the data ingestion script."""
-    print("NCAA Football Data Ingestion Pipeline")
-    print("=" * 50)
-    
-    # Check prerequisites
-    if not check_prerequisites():
-        print("\nPlease fix the issues above and try again.")
-        return
+MODES = ('basic', 'comprehensive', 'players', 'detailed', 'teams', 'full')
+MENU_MODES = {'1': 'basic', '2': 'comprehensive', '3': 'players', '4': 'detailed', '5': 'teams', '6': 'full'}
+# Bounds shared by the CLI flags and the menu prompts
+FIRST_SEASON = 1869
+MAX_WEEKS = 17
+
+def int_in_range(low: int, high: Optional[int] = None) -> Callable[[str], int]:
+    """Build an argparse ``type=`` accepting whole numbers from low to high (unbounded above when high is None)."""
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"{value!r} is not a whole number")
+        if number < low or (high is not None and number > high):
+            bounds = f"from {low} to {high}" if high is not None else f"of at least {low}"
+            raise argparse.ArgumentTypeError(f"expected a number {bounds}, got {number}")
+        return number
+    return parse
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options; with no mode the interactive menu is shown."""
+    parser = argparse.ArgumentParser(description="NCAA Football Data Ingestion Pipeline")
+    parser.add_argument('mode', nargs='?', choices=MODES,
+                        help="collection to run unattended (omit for the interactive menu)")
+    parser.add_argument('--season', type=int_in_range(FIRST_SEASON),
+                        help="season to collect, up to current_season (defaults to current_season)")
+    parser.add_argument('--max-weeks', type=int_in_range(1, MAX_WEEKS), default=15,
+                        help=f"weeks to collect in detailed mode, 1-{MAX_WEEKS} (default 15)")
+    parser.add_argument('--concurrency', type=int_in_range(1),
+                        help="override max_concurrency for in-flight API requests")
+    parser.add_argument('--debug-loop', action='store_true',
+                        help="run asyncio in debug mode and log callbacks that block the loop")
+    return parser.parse_args(argv)
+
+async def run_mode(pipeline: DataIngestionPipeline, mode: str, season: int, max_weeks: int = 15) -> None:
+    """Run a single collection mode without prompting."""
+    if mode == 'basic':
+        print(f"\n🚀 Starting basic data collection for {season}...")
+        await pipeline.collect_all_data(season)
+    elif mode == 'comprehensive':
+        print(f"\n🚀 Starting comprehensive data collection for {season}...")
+        await pipeline.collect_comprehensive_data(season)
+    elif mode == 'players':
+        print(f"\n🚀 Starting player stats collection for {season}...")
+        await pipeline.collect_player_stats_only(season)
+    elif mode == 'detailed':
+        print(f"\n🚀 Starting detailed game data collection for {season}...")
+        await pipeline.collect_detailed_game_data(season, max_weeks)
+    elif mode == 'teams':
+        print("\n🚀 Starting teams data collection...")
+        teams = await pipeline.collector.collect_teams_data()
+        await pipeline.save_data(teams, "teams_test")
+    elif mode == 'full':
+        print(f"\n🚀 Starting full multi-season ingestion...")
+        print(f"Seasons: {pipeline.config.seasons_to_collect}")
+        await pipeline.run_full_ingestion()
+
+@dataclasses.dataclass
+class RunChoices:
+    """Everything decided up front, from flags or the menu, before the pipeline opens its session."""
+    mode: Optional[str]  # None runs the custom selection
+    season: int
+    max_weeks: int = 15
+    custom: Tuple[str, ...] = ()  # datasets picked in the custom selection
+
+CUSTOM_DATASETS = (
+    ('teams', "Teams data? (y/N): "),
+    ('schedule', "Schedule? (y/N): "),
+    ('team_stats', "Team stats? (y/N): "),
+    ('player_stats', "Player stats? (y/N): "),
+    ('game_data', "Game-by-game data? (y/N): "),
+)
+
+def prompt_int(prompt: str, default: int, low: int, high: int) -> int:
+    """Ask for a whole number in [low, high], re-prompting until the answer is one; blank keeps default."""
+    while True:
+        answer = input(prompt).strip()
+        if not answer:
+            return default
+        try:
+            value = int(answer)
+        except ValueError:
+            value = None
+        if value is not None and low <= value <= high:
+            return value
+        print(f"Please enter a number from {low} to {high}.")
+
+def gather_menu_choices(args: argparse.Namespace, config: Config) -> Optional[RunChoices]:
+    """
+    Resolve what to run from the CLI flags, prompting through the menu only when no mode was given.
     
-    # Load configuration
-    config = get_config()
+    All blocking input() happens here, before the event loop starts, so the HTTP session
+    never sits idle waiting on the user. Returns None if the user cancels.
+    """
+    season = args.season or config.current_season
+    max_weeks = args.max_weeks
     
-    # Create pipeline
-    pipeline = DataIngestionPipeline(config)
+    print(f"\nConfigured for season: {season}")
+    print(f"Output directory: {config.output_dir}")
     
-    print(f"\nConfigured for season: {config['current_season']}")
-    print(f"Output directory: {config['output_dir']}")
+    if args.mode is not None:
+        return RunChoices(args.mode, season, max_weeks)
     
     # Menu options
     print("\nData Collection Options:")
@@ -362,108 +965,122 @@ async def main():
     print("7. Custom selection")
     
     choice = input("\nEnter your choice (1-7): ").strip()
+    if choice == "7":
+        print("\n🔧 Custom Selection:")
+        season = prompt_int(f"Enter season year (default {season}): ", season, FIRST_SEASON, config.current_season)
+        
+        print("\nWhat to collect:")
+        custom = tuple(name for name, prompt in CUSTOM_DATASETS if input(prompt).lower() == 'y')
+        if 'game_data' in custom:
+            max_weeks = prompt_int(f"How many weeks? (1-{MAX_WEEKS}): ", 15, 1, MAX_WEEKS)
+        return RunChoices(None, season, max_weeks, custom)
+    
+    mode = MENU_MODES.get(choice)
+    if mode is None:
+        print("Invalid choice. Running basic collection...")
+        mode = 'basic'
+    
+    if mode == 'comprehensive':
+        print("⚠️  This will collect A LOT of data and may take a while!")
+        if input("Continue? (y/N): ").lower() != 'y':
+            return None
+    elif mode == 'detailed':
+        print("⚠️  WARNING: This creates an extremely large dataset!")
+        if input("Continue? (y/N): ").lower() != 'y':
+            return None
+        max_weeks = prompt_int(f"Enter max weeks to collect (1-{MAX_WEEKS}, default 15): ", 15, 1, MAX_WEEKS)
+    elif mode == 'full':
+        print(f"Seasons: {config.seasons_to_collect}")
+        if input("This will take a very long time. Continue? (y/N): ").lower() != 'y':
+            return None
+    
+    return RunChoices(mode, season, max_weeks)
+
+async def run_custom(pipeline: DataIngestionPipeline, season: int, custom: Tuple[str, ...], max_weeks: int) -> None:
+    """Run the datasets picked in the custom selection."""
+    print(f"\n🚀 Starting custom collection for {season}...")
+    
+    if 'teams' in custom:
+        teams = await pipeline.collector.collect_teams_data()
+        await pipeline.save_data(teams, f"custom_teams_{season}")
+    
+    if 'schedule' in custom:
+        schedule = await pipeline.collector.collect_schedule(season)
+        await pipeline.save_data(schedule, f"custom_schedule_{season}")
+    
+    if 'team_stats' in custom:
+        team_stats = await pipeline.collector.collect_team_season_stats(season)
+        await pipeline.save_data(team_stats, f"custom_team_stats_{season}")
+    
+    if 'player_stats' in custom:
+        await pipeline.collect_player_stats_only(season)
+    
+    if 'game_data' in custom:
+        await pipeline.collect_detailed_game_data(season, max_weeks)
+
+async def run_choices(choices: RunChoices, config: Config, debug_loop: bool = False) -> None:
+    """Async phase: open the pipeline only for the I/O and run the pre-decided collection."""
+    if debug_loop:
+        # Flags any sync call (time.sleep, blocking I/O) that holds the loop longer than the threshold
+        loop = asyncio.get_running_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = SLOW_CALLBACK_SECONDS
+    
+    # Create pipeline; the context manager closes its HTTP session and writer threads
+    async with DataIngestionPipeline(config) as pipeline:
+        try:
+            if choices.mode is not None:
+                await run_mode(pipeline, choices.mode, choices.season, choices.max_weeks)
+            else:
+                await run_custom(pipeline, choices.season, choices.custom, choices.max_weeks)
+        except Exception as e:
+            print(f"\n❌ Error during collection: {e}")
+            logger.error(f"Collection error: {e}")
+
+def main(args: argparse.Namespace) -> None:
+    """Main entry point for the data ingestion script."""
+    print("NCAA Football Data Ingestion Pipeline")
+    print("=" * 50)
+    
+    # Check prerequisites
+    if not check_prerequisites():
+        print("\nPlease fix the issues above and try again.")
+        return
+    
+    # Load configuration
+    config = get_config()
+    if args.concurrency:
+        config = dataclasses.replace(config, max_concurrency=args.concurrency)
+    # Checked here rather than by argparse since the bound comes from the configuration
+    if args.season is not None and args.season > config.current_season:
+        print(f"\n--season must be {config.current_season} (current_season) or earlier.")
+        return
+    
+    # Sync phase: settle every choice before the event loop and HTTP session exist
+    try:
+        choices = gather_menu_choices(args, config)
+    except (KeyboardInterrupt, EOFError):
+        print()
+        choices = None
+    if choices is None:
+        print("Cancelled.")
+        return
     
     start_time = datetime.now()
     
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        if choice == "1":
-            print(f"\n🚀 Starting basic data collection for {config['current_season']}...")
-            await pipeline.collect_all_data(config['current_season'])
-            
-        elif choice == "2":
-            print(f"\n🚀 Starting comprehensive data collection for {config['current_season']}...")
-            print("⚠️  This will collect A LOT of data and may take a while!")
-            confirm = input("Continue? (y/N): ").lower()
-            if confirm == 'y':
-                await pipeline.collect_comprehensive_data(config['current_season'])
-            else:
-                print("Cancelled.")
-                return
-                
-        elif choice == "3":
-            print(f"\n🚀 Starting player stats collection for {config['current_season']}...")
-            await pipeline.collect_player_stats_only(config['current_season'])
-            
-        elif choice == "4":
-            print(f"\n🚀 Starting detailed game data collection for {config['current_season']}...")
-            print("⚠️  WARNING: This creates an extremely large dataset!")
-            confirm = input("Continue? (y/N): ").lower()
-            if confirm == 'y':
-                max_weeks = int(input("Enter max weeks to collect (1-17, default 15): ") or "15")
-                await pipeline.collect_detailed_game_data(config['current_season'], max_weeks)
-            else:
-                print("Cancelled.")
-                return
-                
-        elif choice == "5":
-            print("\n🚀 Starting teams data collection...")
-            teams = await pipeline.collector.collect_teams_data()
-            pipeline.save_data(teams, "teams_test")
-            
-        elif choice == "6":
-            print(f"\n🚀 Starting full multi-season ingestion...")
-            print(f"Seasons: {config['seasons_to_collect']}")
-            confirm = input("This will take a very long time. Continue? (y/N): ").lower()
-            if confirm == 'y':
-                await pipeline.run_full_ingestion()
-            else:
-                print("Cancelled.")
-                return
-                
-        elif choice == "7":
-            print("\n🔧 Custom Selection:")
-            season = int(input(f"Enter season year (default {config['current_season']}): ") or str(config['current_season']))
-            
-            print("\nWhat to collect:")
-            collect_teams = input("Teams data? (y/N): ").lower() == 'y'
-            collect_schedule = input("Schedule? (y/N): ").lower() == 'y'
-            collect_team_stats = input("Team stats? (y/N): ").lower() == 'y'
-            collect_player_stats = input("Player stats? (y/N): ").lower() == 'y'
-            collect_game_data = input("Game-by-game data? (y/N): ").lower() == 'y'
-            
-            print(f"\n🚀 Starting custom collection for {season}...")
-            # Implement custom collection logic here
-            custom_data = {}
-            
-            if collect_teams:
-                teams = await pipeline.collector.collect_teams_data()
-                pipeline.save_data(teams, f"custom_teams_{season}")
-                custom_data['teams'] = teams
-            
-            if collect_schedule:
-                schedule = await pipeline.collector.collect_schedule(season)
-                pipeline.save_data(schedule, f"custom_schedule_{season}")
-                custom_data['schedule'] = schedule
-            
-            if collect_team_stats:
-                team_stats = await pipeline.collector.collect_team_season_stats(season)
-                pipeline.save_data(team_stats, f"custom_team_stats_{season}")
-                custom_data['team_stats'] = team_stats
-            
-            if collect_player_stats:
-                await pipeline.collect_player_stats_only(season)
-            
-            if collect_game_data:
-                weeks = int(input("How many weeks? (1-17): ") or "15")
-                await pipeline.collect_detailed_game_data(season, weeks)
-            
-        else:
-            print("Invalid choice. Running basic collection...")
-            await pipeline.collect_all_data(config['current_season'])
-            
+        run(run_choices(choices, config, debug_loop=args.debug_loop))
     except KeyboardInterrupt:
         print("\n\n❌ Collection interrupted by user.")
-    except Exception as e:
-        print(f"\n❌ Error during collection: {e}")
-        logger.error(f"Collection error: {e}")
     
     end_time = datetime.now()
     duration = end_time - start_time
     
     print(f"\n✅ Collection completed!")
     print(f"Duration: {duration}")
-    print(f"Check {config['output_dir']} for collected data files.")
+    print(f"Check {config.output_dir} for collected data files.")
     print(f"Check data_collection.log for detailed logs.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main(parse_args())
@@ -1,12 +1,295 @@
 import asyncio
 import aiohttp
-import json
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import random
+import sys
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+from dataclasses import dataclass, fields
 from datetime import datetime
-import pandas as pd
-from ratelimit import limits, sleep_and_retry
-import redis
+import orjson
+from aiolimiter import AsyncLimiter
+import redis.asyncio as aioredis
+
+# Optional C parser for the APIs' ISO 8601 timestamps; datetime.fromisoformat is used without it
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# Optional typed decoding of large payloads; plain orjson dicts are used when it isn't installed
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if TYPE_CHECKING:
+    from config import Config
+
+
+# Exponential backoff bounds (seconds) for retrying rate-limited or timed-out requests
+RETRY_MIN_DELAY = 1
+RETRY_MAX_DELAY = 30
+# Season-level team endpoints that take only a year, fetched together by collect_season_bundle
+SEASON_BUNDLE_ENDPOINTS = {
+    'team_season_stats': '/stats/season',
+    'team_advanced_stats': '/stats/season/advanced',
+    'talent_ratings': '/talent',
+    'recruiting': '/recruiting/teams',
+}
+
+# Weeks fetched for per-week endpoints; CFBD's /games/teams and /games/players need a week
+# (or team/conference) filter, so a season is always one request per week
+REGULAR_SEASON_WEEKS = range(1, 16)
+
+# Per-request limits for the HTTP sessions used to reach the APIs
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+# Open connections across both APIs in one session; per host it's config.max_conns_per_host
+CONNECTION_POOL_LIMIT = 64
+
+# Longest server-requested wait (Retry-After / X-RateLimit-Reset) we're willing to honour
+RETRY_MAX_HINT = 300
+
+# Each request is cached as one Redis hash: ``body`` (the zlib-compressed JSON), ``expires``
+# (epoch seconds it goes stale; absent for entries that never do), the response's ``etag`` /
+# ``last_modified`` validators and ``failed_until`` (see below). The version in the key prefix
+# keeps entries in older layouts from being read back
+CACHE_KEY_PREFIX = "ncaa_cache:v3:"
+CACHE_COMPRESSION_LEVEL = 3
+
+# The Odds API quota is metered per hour rather than per minute
+ODDS_REQUESTS_PER_HOUR = 450
+
+# A response the API refused (404, 400, exhausted 429s, ...) sets ``failed_until`` so repeat calls
+# skip the network for a while; _cache_lookup returns this marker in place of the body meanwhile
+# (zlib output never starts with a NUL byte, so it can't collide)
+NEGATIVE_CACHE_MARKER = b'\x00NEG'
+# Base lifetime (seconds) of a negative entry; stretched to any Retry-After the server gave,
+# then jittered so a batch of failures doesn't expire and refetch in lockstep
+NEGATIVE_CACHE_TTL = 60
+NEGATIVE_CACHE_JITTER = 0.25
+
+# Expiring entries whose response carried an ETag or Last-Modified are kept this many seconds
+# past going stale, so the next fetch can be a conditional request where a 304 costs no body bytes
+VALIDATOR_RETENTION = 7 * 24 * 3600
+# (field stored in the hash, response header it comes from, request header it goes back in)
+VALIDATOR_HEADERS = (
+    ('etag', 'ETag', 'If-None-Match'),
+    ('last_modified', 'Last-Modified', 'If-Modified-Since'),
+)
+
+# Cache lifetime (seconds) for responses not tied to a season; season data uses the
+# configurable cache_ttl_current / cache_ttl_historical lifetimes
+CACHE_TTL_DEFAULT = 3600
+
+
+def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read how long the server wants us to wait from rate-limit response headers.
+    
+    Prefers ``Retry-After`` (in seconds); otherwise, once ``X-RateLimit-Remaining`` hits
+    zero, waits out ``X-RateLimit-Reset``, which may be seconds left or an epoch timestamp.
+    
+    Args:
+        headers (Mapping[str, str]): Response headers
+        
+    Returns:
+        Optional[float]: Seconds to wait, capped at RETRY_MAX_HINT, or None without a usable hint
+    """
+    try:
+        if 'Retry-After' in headers:
+            wait = float(headers['Retry-After'])
+        elif headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+            wait = float(headers['X-RateLimit-Reset'])
+            if wait > 1e9:
+                wait -= time.time()
+        else:
+            return None
+    except ValueError:
+        # e.g. an HTTP-date Retry-After; fall back to exponential backoff
+        return None
+    return min(max(wait, 0.0), RETRY_MAX_HINT)
+
+
+class _HTTPFailure(NamedTuple):
+    """A non-200 response from _request, kept so the failure can be negatively cached."""
+    status: int
+    retry_after: Optional[float]
+    
+    @property
+    def cache_ttl(self) -> int:
+        """Seconds to remember this failure in the cache, freshly jittered on each access."""
+        ttl = max(NEGATIVE_CACHE_TTL, self.retry_after or 0)
+        return int(ttl * random.uniform(1, 1 + NEGATIVE_CACHE_JITTER))
+
+
+def _pack(body: bytes) -> bytes:
+    """Compress a raw JSON response body for the cache (zlib, typically 5-10x smaller)."""
+    return zlib.compress(body, CACHE_COMPRESSION_LEVEL)
+
+
+def _unpack(blob: bytes, decode: Callable[[bytes], Any] = orjson.loads) -> Any:
+    """Decode a cached response written by _pack."""
+    return decode(zlib.decompress(blob))
+
+
+def _fromisoformat_z(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting the trailing 'Z' that fromisoformat rejects before 3.11."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# ciso8601 parses the 'Z' suffix itself and is many times faster than fromisoformat
+_parse_iso = ciso8601.parse_datetime if ciso8601 is not None else _fromisoformat_z
+
+
+def create_session(config: 'Config') -> aiohttp.ClientSession:
+    """
+    Open a pooled keep-alive HTTP session for the APIs, so TLS handshakes are paid once per connection.
+    
+    Args:
+        config (Config): Configuration providing the per-host connection cap
+        
+    Returns:
+        aiohttp.ClientSession: The session; the caller closes it
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_POOL_LIMIT,
+        limit_per_host=config.max_conns_per_host,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT)
+
+
+def _intern(name: Optional[str]) -> Optional[str]:
+    """Intern a team name so the rows of a season share one string per team."""
+    return sys.intern(name) if name else name
+
+
+# Collected rows are slotted dataclasses rather than dicts: no per-row hash table, so a season of
+# rows takes a fraction of the memory. orjson serializes them natively, with the same keys.
+@dataclass(slots=True)
+class GameRow:
+    """One game from collect_schedule."""
+    id: Optional[int] = None
+    season: Optional[int] = None
+    week: Optional[int] = None
+    season_type: Optional[str] = None
+    start_date: Optional[datetime] = None
+    home_team: Optional[str] = None
+    away_team: Optional[str] = None
+    home_points: Optional[int] = None
+    away_points: Optional[int] = None
+    venue: Optional[str] = None
+    venue_id: Optional[int] = None
+    neutral_site: Optional[bool] = None
+    conference_game: Optional[bool] = None
+    attendance: Optional[int] = None
+
+
+# Columns kept from each /games row by collect_schedule, in output order
+SCHEDULE_FIELDS = tuple(field.name for field in fields(GameRow))
+
+
+@dataclass(slots=True)
+class TeamGameStats:
+    """One team's side of collect_game_stats; field names keep CFBD's camelCase stat keys."""
+    team: str
+    totalYards: Any = None
+    netPassingYards: Any = None
+    rushingYards: Any = None
+    turnovers: Any = None
+    thirdDownEff: Any = None
+    sacks: Any = None
+    tacklesForLoss: Any = None
+    passCompletionPercentage: Any = None
+    timeOfPossession: Any = None
+    firstDowns: Any = None
+    fourthDownEff: Any = None
+    penalties: Any = None
+    penaltyYards: Any = None
+
+
+# Stat keys copied from each team's /stats/game/advanced entry into TeamGameStats
+TEAM_GAME_STAT_FIELDS = tuple(field.name for field in fields(TeamGameStats))[1:]
+
+
+@dataclass(slots=True)
+class BettingLine:
+    """One bookmaker's lines for a game from collect_betting_lines."""
+    home_team: Optional[str]
+    away_team: Optional[str]
+    commence_time: Optional[datetime]
+    bookmaker: Optional[str]
+    spread_point: Optional[float] = None
+    spread_home_price: Optional[float] = None
+    spread_away_price: Optional[float] = None
+    total_point: Optional[float] = None
+    total_over_price: Optional[float] = None
+    total_under_price: Optional[float] = None
+
+
+if msgspec is not None:
+    class Game(msgspec.Struct):
+        """
+        A /games row as collect_schedule keeps it; msgspec skips the other fields while parsing.
+        
+        Fields are deliberately untyped, so an odd value in one row (say an ``"N/A"`` attendance)
+        passes through as-is, as it does on the orjson path, instead of failing the whole season.
+        """
+        id: Any = None
+        season: Any = None
+        week: Any = None
+        season_type: Any = None
+        start_date: Any = None
+        home_team: Any = None
+        away_team: Any = None
+        home_points: Any = None
+        away_points: Any = None
+        venue: Any = None
+        venue_id: Any = None
+        neutral_site: Any = None
+        conference_game: Any = None
+        attendance: Any = None
+
+
+class AdaptiveConcurrency:
+    """
+    Cap on in-flight requests adjusted by AIMD (additive increase, multiplicative decrease).
+    
+    The limit grows by one after each successful response, up to ``maximum``, and halves
+    (down to one) whenever the server signals overload with a 429 or 5xx. Used as an
+    ``async with`` block around each request.
+    """
+    
+    def __init__(self, maximum: int) -> None:
+        self.maximum = max(1, maximum)
+        self.limit = self.maximum
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+    
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+    
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            # The limit may have grown since the last release, so wake everyone it now admits
+            if self._in_flight < self.limit:
+                self._cond.notify(self.limit - self._in_flight)
+    
+    def on_success(self) -> None:
+        """Additive increase after a successful response."""
+        if self.limit < self.maximum:
+            self.limit += 1
+    
+    def on_overload(self) -> None:
+        """Multiplicative decrease after a 429 or 5xx."""
+        self.limit = max(1, self.limit // 2)
 
 
 class NCAADataCollector:
@@ -15,34 +298,119 @@ class NCAADataCollector:
     
     This class handles fetching team data, schedules, game statistics, and betting lines
     with built-in caching, rate limiting, and error handling.
+    
+    All of its work is network I/O on the running event loop, so it benefits directly from
+    uvloop. The collector doesn't install a loop itself; entry points should start it with
+    ``uvloop.run(...)`` where available, as ``main.py`` does, falling back to ``asyncio.run``.
     """
     
-    def __init__(self, config: Dict) -> None:
+    def __init__(self, config: 'Config', session: Optional[aiohttp.ClientSession] = None) -> None:
         """
         Initialize the NCAA Data Collector.
         
         Args:
-            config (Dict): Configuration dictionary containing API keys, Redis settings, etc.
+            config (Config): Configuration containing API keys, Redis settings, etc.
+            session (aiohttp.ClientSession, optional): Shared HTTP session whose lifecycle the
+                caller owns; without one the collector opens its own on first use
         """
         self.config = config
+        self._session = session
+        self._owns_session = session is None
         self.logger = logging.getLogger(__name__)
-        self.redis_client = redis.Redis(
-            host=config['redis_host'], 
-            port=config.get('redis_port', 6379),
-            decode_responses=True
+        # Async client so cache round-trips overlap with in-flight HTTP instead of blocking the loop;
+        # values stay raw bytes, which orjson reads directly without a UTF-8 decode
+        self.redis_client = aioredis.Redis(
+            host=config.redis_host,
+            port=config.redis_port,
+            max_connections=32
         )
         
         self.base_endpoints = {
             'cfbd': 'https://api.collegefootballdata.com',
             'odds': 'https://api.the-odds-api.com/v4'
         }
+        
+        # Request URLs and the CFBD auth header are built once rather than on every call. The
+        # key stays out of the session's default headers since that session also calls The Odds API
+        cfbd = self.base_endpoints['cfbd']
+        self._urls = {
+            'player_season_stats': f"{cfbd}/stats/player/season",
+            'player_game_stats': f"{cfbd}/games/players",
+            'team_game_stats': f"{cfbd}/games/teams",
+            'teams': f"{cfbd}/teams/fbs",
+            'schedule': f"{cfbd}/games",
+            'game_stats': f"{cfbd}/stats/game/advanced",
+            'betting_lines': f"{self.base_endpoints['odds']}/sports/americanfootball_ncaaf/odds",
+        }
+        self._urls.update({key: f"{cfbd}{path}" for key, path in SEASON_BUNDLE_ENDPOINTS.items()})
+        self._cfbd_headers = {'Authorization': f"Bearer {config.cfbd_api_key}"}
+        
+        # Token buckets shared by every request this collector makes to each API
+        self.cfbd_limiter = AsyncLimiter(config.cfbd_requests_per_minute, 60)
+        self.odds_limiter = AsyncLimiter(ODDS_REQUESTS_PER_HOUR, 3600)
+        # /games payloads are the largest; with msgspec they decode straight to the kept fields
+        self._games_decoder = msgspec.json.Decoder(List[Game]) if msgspec is not None else None
+        
+        # Pending _fetch_data calls by cache key, so concurrent duplicates make one request
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # In-flight cap that backs off when the APIs push back and creeps up while they don't
+        self.concurrency = AdaptiveConcurrency(config.max_concurrency)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening a pooled keep-alive one on first use if none was given."""
+        if self._session is None or self._session.closed:
+            self._session = create_session(self.config)
+            self._owns_session = True
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the Redis connections, and the HTTP session if the collector opened it."""
+        await self.redis_client.aclose()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _season_ttl(self, season: int) -> Optional[int]:
+        """Cache lifetime for a season's data: completed seasons may never expire, the current one does."""
+        if season < self.config.current_season:
+            return self.config.cache_ttl_historical
+        return self.config.cache_ttl_current
+    
+    def _game_ttl(self, season: Optional[int], completed: bool) -> Optional[int]:
+        """
+        Cache lifetime for one game's stats.
+        
+        Only a game known to be final (``completed``, or from a completed season) gets the long
+        historical lifetime; otherwise its stats may still be partial, so they expire like the
+        current season's.
+        """
+        if completed or (season is not None and season < self.config.current_season):
+            return self.config.cache_ttl_historical
+        return self.config.cache_ttl_current
+    
+    def _cache_key(self, url: str, params: Optional[Dict] = None) -> str:
+        """
+        Build the Redis key for a request from its URL and sorted query parameters.
+        
+        The URL and the parameters are hashed to a fixed 128-bit BLAKE2b digest so keys stay
+        short in Redis memory and on the wire however long the URL and parameters get. The
+        parameters go in as key-sorted JSON, which orjson sorts and encodes in one C call
+        instead of a Python sort, list of f-strings and join per request.
+        """
+        hasher = hashlib.blake2b(url.encode(), digest_size=16)
+        if params:
+            hasher.update(orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        return CACHE_KEY_PREFIX + hasher.hexdigest()
     
     async def _fetch_data(
         self, 
         session: aiohttp.ClientSession, 
         url: str, 
         headers: Dict = None, 
-        params: Dict = None
+        params: Dict = None,
+        limiter: Optional[AsyncLimiter] = None,
+        ttl: Optional[int] = CACHE_TTL_DEFAULT,
+        decode: Callable[[bytes], Any] = orjson.loads
     ) -> Optional[Dict]:
         """
         Private method to fetch data from APIs with caching and error handling.
@@ -52,57 +420,360 @@ class NCAADataCollector:
             url (str): The URL to fetch data from
             headers (Dict, optional): HTTP headers to include in the request
             params (Dict, optional): Query parameters to include in the request
+            limiter (AsyncLimiter, optional): Rate limiter to acquire before hitting the network
+            ttl (int, optional): Seconds to keep a successful response in the cache; None never expires
+            decode (Callable[[bytes], Any], optional): Parser for the JSON body, cached or fresh
             
         Returns:
             Optional[Dict]: The JSON response data or None if request failed
         """
-        # Create cache key from URL and params
-        cache_key = f"ncaa_cache:{url}"
-        if params:
-            param_str = "&".join([f"{k}={v}" for k, v in sorted(params.items())])
-            cache_key += f"?{param_str}"
+        cache_key = self._cache_key(url, params)
+        
+        # Concurrent callers for the same request share the first one's fetch
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
         
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            json_data = await self._read_through(session, cache_key, url, headers, params, limiter, ttl, decode)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark it retrieved so a fetch nobody else was waiting on doesn't warn at GC
+                future.exception()
+            raise
+        else:
+            future.set_result(json_data)
+        finally:
+            del self._inflight[cache_key]
+        
+        return json_data
+    
+    async def _read_through(
+        self,
+        session: aiohttp.ClientSession,
+        cache_key: str,
+        url: str,
+        headers: Optional[Dict],
+        params: Optional[Dict],
+        limiter: Optional[AsyncLimiter],
+        ttl: Optional[int],
+        decode: Callable[[bytes], Any]
+    ) -> Optional[Any]:
+        """Serve one request from Redis, falling back to the network and caching the response."""
         # Check Redis cache first
         try:
-            cached_data = self.redis_client.get(cache_key)
-            if cached_data:
-                self.logger.info(f"Cache hit for {cache_key}")
-                return json.loads(cached_data)
+            entry = await self.redis_client.hgetall(cache_key)
         except Exception as e:
             self.logger.warning(f"Redis cache read error: {e}")
+            entry = {}
+        
+        cached_data, validators = self._cache_lookup(entry, ttl)
+        if cached_data == NEGATIVE_CACHE_MARKER:
+            self.logger.info(f"Skipping {url}: it failed recently")
+            return None
+        if cached_data:
+            self.logger.info(f"Cache hit for {url}")
+            return _unpack(cached_data, decode)
+        
+        body = await self._request(
+            session, url, headers=headers, params=params, limiter=limiter, validators=validators
+        )
+        json_data = self._decode_body(url, body, decode)
+        
+        # Cache the body as received, so a miss costs one parse and no re-encode
+        # (empty responses may still fill in later)
+        if json_data or isinstance(body, _HTTPFailure):
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    if json_data:
+                        self._queue_store(pipe, cache_key, body, validators, ttl)
+                    else:
+                        self._queue_failure(pipe, cache_key, body, validators)
+                    await pipe.execute()
+                if json_data:
+                    self.logger.info(f"Cached response for {url}")
+            except Exception as e:
+                self.logger.warning(f"Redis cache write error: {e}")
+        
+        return json_data
+    
+    async def _fetch_many(
+        self,
+        session: aiohttp.ClientSession,
+        requests: List[Tuple[str, Optional[Dict], Optional[Dict]]],
+        limiter: Optional[AsyncLimiter] = None,
+        ttl: Optional[int] = CACHE_TTL_DEFAULT,
+        ttls: Optional[List[Optional[int]]] = None
+    ) -> List[Optional[Any]]:
+        """
+        Fetch several requests with one pipelined Redis round-trip for the cache lookups.
+        
+        Cache misses go out concurrently (conditional on any validators the same lookup
+        returned) and their responses are written back in a second pipeline, so a warm
+        cache costs one round-trip however many requests.
+        
+        Args:
+            session (aiohttp.ClientSession): The aiohttp session to use for requests
+            requests (List[Tuple[str, Optional[Dict], Optional[Dict]]]): (url, headers, params) per request
+            limiter (AsyncLimiter, optional): Rate limiter to acquire before each network request
+            ttl (int, optional): Seconds to keep successful responses in the cache; None never expires
+            ttls (List[Optional[int]], optional): Per-request lifetimes, in request order, overriding ttl
+            
+        Returns:
+            List[Optional[Any]]: The JSON response data (or None on failure) for each request, in order
+        """
+        cache_keys = [self._cache_key(url, params) for url, _, params in requests]
+        ttls = [ttl] * len(requests) if ttls is None else ttls
         
-        # Make web request if not in cache
         try:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    json_data = await response.json()
-                    
-                    # Cache the successful response
-                    try:
-                        self.redis_client.setex(
-                            cache_key, 
-                            3600,  # 1 hour expiration
-                            json.dumps(json_data, default=str)
-                        )
-                        self.logger.info(f"Cached response for {cache_key}")
-                    except Exception as e:
-                        self.logger.warning(f"Redis cache write error: {e}")
-                    
-                    return json_data
-                else:
-                    self.logger.error(f"HTTP {response.status} error for URL: {url}")
-                    return None
-                    
-        except aiohttp.ClientError as e:
-            self.logger.error(f"Connection error for URL {url}: {e}")
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for cache_key in cache_keys:
+                    pipe.hgetall(cache_key)
+                entries = await pipe.execute()
+        except Exception as e:
+            self.logger.warning(f"Redis cache read error: {e}")
+            entries = [{}] * len(requests)
+        
+        lookups = [self._cache_lookup(entry, expiry) for entry, expiry in zip(entries, ttls)]
+        results = [
+            _unpack(cached_data) if cached_data and cached_data != NEGATIVE_CACHE_MARKER else None
+            for cached_data, _ in lookups
+        ]
+        misses = [i for i, (cached_data, _) in enumerate(lookups) if not cached_data]
+        self.logger.info(f"Cache hits for {len(requests) - len(misses)}/{len(requests)} batched requests")
+        
+        fetched = await asyncio.gather(*(
+            self._request(
+                session, requests[i][0], headers=requests[i][1], params=requests[i][2],
+                limiter=limiter, validators=lookups[i][1]
+            )
+            for i in misses
+        ))
+        
+        stored = failed = 0
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for i, body in zip(misses, fetched):
+                    results[i] = json_data = self._decode_body(requests[i][0], body)
+                    if json_data:
+                        self._queue_store(pipe, cache_keys[i], body, lookups[i][1], ttls[i])
+                        stored += 1
+                    elif isinstance(body, _HTTPFailure):
+                        self._queue_failure(pipe, cache_keys[i], body, lookups[i][1])
+                        failed += 1
+                if stored or failed:
+                    await pipe.execute()
+            if stored:
+                self.logger.info(f"Cached {stored} batched responses")
+        except Exception as e:
+            self.logger.warning(f"Redis cache write error: {e}")
+        
+        return results
+    
+    @staticmethod
+    def _cache_lookup(
+        entry: Dict[bytes, bytes], ttl: Optional[int]
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, Any]]]:
+        """
+        Interpret a cache entry read with HGETALL.
+        
+        Args:
+            entry (Dict[bytes, bytes]): The entry's fields, empty when nothing is cached
+            ttl (int, optional): Lifetime the caller will cache a fresh response for
+            
+        Returns:
+            Tuple[Optional[bytes], Optional[Dict[str, Any]]]: The packed body if still fresh (or
+                NEGATIVE_CACHE_MARKER while a failure is remembered), else None; and the validators
+                to send with the request, which is ``body`` (the stale packed body) plus any of
+                ``etag`` / ``last_modified``, empty when nothing usable is stored, or None when
+                the response won't expire and so isn't worth revalidating later
+        """
+        now = time.time()
+        if b'failed_until' in entry and float(entry[b'failed_until']) > now:
+            return NEGATIVE_CACHE_MARKER, None
+        body = entry.get(b'body')
+        if body and (b'expires' not in entry or float(entry[b'expires']) > now):
+            return body, None
+        
+        if ttl is None:
+            return None, None
+        validators = {
+            field: entry[field.encode()].decode()
+            for field, _, _ in VALIDATOR_HEADERS
+            if field.encode() in entry
+        }
+        if not (body and validators):
+            return None, {}
+        validators['body'] = body
+        return None, validators
+    
+    @staticmethod
+    def _queue_store(
+        pipe: Any, cache_key: str, body: bytes, validators: Optional[Dict[str, Any]], ttl: Optional[int]
+    ) -> None:
+        """
+        Queue the commands caching a fresh response body on a Redis pipeline.
+        
+        The entry replaces whatever was stored (a stale body, a remembered failure). When the
+        response carried validators it outlives its freshness by VALIDATOR_RETENTION, so the
+        one stored body serves both cache hits and 304s.
+        """
+        entry = {**(validators or {}), 'body': _pack(body)}
+        pipe.delete(cache_key)
+        if ttl is None:
+            pipe.hset(cache_key, mapping=entry)
+            return
+        entry['expires'] = time.time() + ttl
+        pipe.hset(cache_key, mapping=entry)
+        pipe.expire(cache_key, ttl + VALIDATOR_RETENTION if validators else ttl)
+    
+    @staticmethod
+    def _queue_failure(
+        pipe: Any, cache_key: str, failure: _HTTPFailure, validators: Optional[Dict[str, Any]]
+    ) -> None:
+        """Queue the commands remembering a refused request, keeping any stale body still worth revalidating."""
+        # cache_ttl is jittered on every read, so take it once for both the marker and the expiry
+        ttl = failure.cache_ttl
+        pipe.hset(cache_key, 'failed_until', time.time() + ttl)
+        if not validators:
+            pipe.expire(cache_key, ttl)
+    
+    def _decode_games(self, body: bytes) -> Any:
+        """Decode a /games body to Game structs, or to plain dicts when it isn't a list of objects."""
+        if self._games_decoder is not None:
+            try:
+                return self._games_decoder.decode(body)
+            except msgspec.ValidationError:
+                pass
+        return orjson.loads(body)
+    
+    def _decode_body(
+        self,
+        url: str,
+        body: Union[bytes, _HTTPFailure, None],
+        decode: Callable[[bytes], Any] = orjson.loads
+    ) -> Optional[Any]:
+        """Parse a response body from _request, logging and returning None if it isn't valid JSON."""
+        if not isinstance(body, bytes):
             return None
+        try:
+            return decode(body)
         except Exception as e:
-            self.logger.error(f"Unexpected error for URL {url}: {e}")
+            self.logger.error(f"Invalid JSON from URL {url}: {e}")
             return None
+    
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict = None,
+        params: Dict = None,
+        limiter: Optional[AsyncLimiter] = None,
+        validators: Optional[Dict[str, Any]] = None
+    ) -> Union[bytes, _HTTPFailure, None]:
+        """
+        Hit the network for one request, backing off on rate limits and timeouts; bypasses the cache.
+        
+        Returns the raw response body so it can be cached as-is; callers parse it with _decode_body.
+        A non-200 response comes back as an _HTTPFailure and a connection failure as None.
+        
+        With ``validators`` from _cache_lookup the request is conditional: a 304 returns the
+        stored body, and a 200 replaces the dict's contents with the new response's validators.
+        """
+        if validators:
+            headers = dict(headers or {})
+            for field, _, request_header in VALIDATOR_HEADERS:
+                if field in validators:
+                    headers[request_header] = validators[field]
+        
+        max_attempts = self.config.max_retries
+        for attempt in range(1, max_attempts + 1):
+            retry_after = None
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+                async with self.concurrency, session.get(url, headers=headers, params=params) as response:
+                    if response.status == 200:
+                        self.concurrency.on_success()
+                        if validators is not None:
+                            validators.clear()
+                            for field, response_header, _ in VALIDATOR_HEADERS:
+                                if response_header in response.headers:
+                                    validators[field] = response.headers[response_header]
+                        return await response.read()
+                    if response.status == 304 and validators:
+                        self.concurrency.on_success()
+                        self.logger.info(f"Not modified since last fetch: {url}")
+                        return zlib.decompress(validators['body'])
+                    if response.status == 429 or response.status >= 500:
+                        self.concurrency.on_overload()
+                    if response.status == 429 and attempt < max_attempts:
+                        reason = "HTTP 429"
+                        retry_after = _retry_after(response.headers)
+                    else:
+                        self.logger.error(f"HTTP {response.status} error for URL: {url}")
+                        return _HTTPFailure(response.status, _retry_after(response.headers))
+                        
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                if attempt == max_attempts:
+                    self.logger.error(f"Connection error for URL {url}: {e}")
+                    return None
+                reason = repr(e)
+            except aiohttp.ClientError as e:
+                self.logger.error(f"Connection error for URL {url}: {e}")
+                return None
+            except Exception as e:
+                self.logger.error(f"Unexpected error for URL {url}: {e}")
+                return None
+            
+            # Honour the server's hint when it gives one; jitter keeps concurrent retries from syncing up
+            if retry_after is not None:
+                delay = retry_after
+            else:
+                delay = min(RETRY_MAX_DELAY, RETRY_MIN_DELAY * 2 ** (attempt - 1)) + random.random()
+            self.logger.warning(
+                f"{reason} for URL {url}, retrying in {delay:.1f}s (attempt {attempt}/{max_attempts})"
+            )
+            await asyncio.sleep(delay)
+    
+    async def collect_season_bundle(self, season: int, datasets: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+        """
+        Collect the season-level team datasets together through one batched cache lookup.
+        
+        Args:
+            season (int): The season year
+            datasets (List[str], optional): Keys of SEASON_BUNDLE_ENDPOINTS to fetch; all by default
+        
+        Returns:
+            Dict[str, List[Dict]]: Records per dataset key (empty list if that request failed)
+        """
+        datasets = list(SEASON_BUNDLE_ENDPOINTS) if datasets is None else datasets
+        headers = self._cfbd_headers
+        requests = [
+            (self._urls[key], headers, {'year': season})
+            for key in datasets
+        ]
+        
+        results = await self._fetch_many(
+            await self._get_session(), requests,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        bundle = {}
+        for key, data in zip(datasets, results):
+            if data:
+                self.logger.info(f"Successfully collected {key} for {len(data)} teams in {season}")
+            else:
+                self.logger.error(f"Failed to collect {key} for {season}")
+            bundle[key] = data or []
+        return bundle
     # Add these methods to your NCAADataCollector class:
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_player_season_stats(self, season: int, category: str = None) -> List[Dict]:
         """
         Collect detailed player statistics for a season.
@@ -114,26 +785,24 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of player statistics
         """
-        url = f"{self.base_endpoints['cfbd']}/stats/player/season"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['player_season_stats']
+        headers = self._cfbd_headers
         params = {'year': season}
         if category:
             params['category'] = category
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
-            
-            if data:
-                self.logger.info(f"Successfully collected {len(data)} player stats for {season}")
-                return data
-            else:
-                self.logger.error(f"Failed to collect player stats for {season}")
-                return []
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected {len(data)} player stats for {season}")
+            return data
+        else:
+            self.logger.error(f"Failed to collect player stats for {season}")
+            return []
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_team_season_stats(self, season: int) -> List[Dict]:
         """
         Collect comprehensive team statistics for a season.
@@ -144,24 +813,22 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of team season statistics
         """
-        url = f"{self.base_endpoints['cfbd']}/stats/season"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['team_season_stats']
+        headers = self._cfbd_headers
         params = {'year': season}
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
-            
-            if data:
-                self.logger.info(f"Successfully collected team season stats for {len(data)} teams in {season}")
-                return data
-            else:
-                self.logger.error(f"Failed to collect team season stats for {season}")
-                return []
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected team season stats for {len(data)} teams in {season}")
+            return data
+        else:
+            self.logger.error(f"Failed to collect team season stats for {season}")
+            return []
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_team_advanced_season_stats(self, season: int) -> List[Dict]:
         """
         Collect advanced team statistics (efficiency, explosiveness, etc.).
@@ -172,24 +839,22 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of advanced team statistics
         """
-        url = f"{self.base_endpoints['cfbd']}/stats/season/advanced"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['team_advanced_stats']
+        headers = self._cfbd_headers
         params = {'year': season}
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
-            
-            if data:
-                self.logger.info(f"Successfully collected advanced team stats for {len(data)} teams in {season}")
-                return data
-            else:
-                self.logger.error(f"Failed to collect advanced team stats for {season}")
-                return []
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected advanced team stats for {len(data)} teams in {season}")
+            return data
+        else:
+            self.logger.error(f"Failed to collect advanced team stats for {season}")
+            return []
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_team_talent_ratings(self, season: int) -> List[Dict]:
         """
         Collect team talent composite ratings.
@@ -200,24 +865,22 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of team talent ratings
         """
-        url = f"{self.base_endpoints['cfbd']}/talent"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['talent_ratings']
+        headers = self._cfbd_headers
         params = {'year': season}
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
-            
-            if data:
-                self.logger.info(f"Successfully collected talent ratings for {len(data)} teams in {season}")
-                return data
-            else:
-                self.logger.error(f"Failed to collect talent ratings for {season}")
-                return []
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected talent ratings for {len(data)} teams in {season}")
+            return data
+        else:
+            self.logger.error(f"Failed to collect talent ratings for {season}")
+            return []
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_recruiting_data(self, season: int) -> List[Dict]:
         """
         Collect recruiting class data.
@@ -228,24 +891,22 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of recruiting data
         """
-        url = f"{self.base_endpoints['cfbd']}/recruiting/teams"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['recruiting']
+        headers = self._cfbd_headers
         params = {'year': season}
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
-            
-            if data:
-                self.logger.info(f"Successfully collected recruiting data for {len(data)} teams in {season}")
-                return data
-            else:
-                self.logger.error(f"Failed to collect recruiting data for {season}")
-                return []
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected recruiting data for {len(data)} teams in {season}")
+            return data
+        else:
+            self.logger.error(f"Failed to collect recruiting data for {season}")
+            return []
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_player_game_stats(self, season: int, week: int = None, team: str = None) -> List[Dict]:
         """
         Collect individual player game statistics.
@@ -258,32 +919,33 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of player game statistics
         """
-        url = f"{self.base_endpoints['cfbd']}/games/players"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['player_game_stats']
+        headers = self._cfbd_headers
         params = {'year': season}
         if week:
             params['week'] = week
         if team:
             params['team'] = team
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
-            
-            if data:
-                self.logger.info(f"Successfully collected player game stats: {len(data)} games")
-                return data
-            else:
-                self.logger.error(f"Failed to collect player game stats")
-                return []
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected player game stats: {len(data)} games")
+            return data
+        else:
+            self.logger.error(f"Failed to collect player game stats")
+            return []
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_team_game_stats(self, season: int, week: int = None) -> List[Dict]:
         """
         Collect team game statistics (detailed box scores).
         
+        CFBD rejects a season-wide query on this endpoint without a week, team or
+        conference filter, so whole seasons are fetched as concurrent per-week calls.
+        
         Args:
             season (int): The season year
             week (int, optional): Specific week
@@ -291,26 +953,60 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of team game statistics
         """
-        url = f"{self.base_endpoints['cfbd']}/games/teams"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['team_game_stats']
+        headers = self._cfbd_headers
         params = {'year': season}
         if week:
             params['week'] = week
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season)
+        )
+        
+        if data:
+            self.logger.info(f"Successfully collected team game stats: {len(data)} games")
+            return data
+        else:
+            self.logger.error(f"Failed to collect team game stats")
+            return []
+    
+    async def _collect_weeks(self, fetch, season: int, weeks: Iterable[int]) -> List[Dict]:
+        """Run ``fetch(season, week)`` for every week at once and concatenate the results in week order."""
+        # Requests still queue on the rate limiter and AIMD gate, so gathering them all is safe
+        results = await asyncio.gather(*(fetch(season, week) for week in weeks))
+        return [row for week_rows in results for row in week_rows]
+    
+    async def collect_team_game_stats_season(
+        self, season: int, weeks: Iterable[int] = REGULAR_SEASON_WEEKS
+    ) -> List[Dict]:
+        """
+        Collect team game statistics for a whole season, fetching the weeks concurrently.
+        
+        Args:
+            season (int): The season year
+            weeks (Iterable[int], optional): Weeks to fetch, the regular season by default
+        
+        Returns:
+            List[Dict]: Team game statistics for every week, in week order
+        """
+        return await self._collect_weeks(self.collect_team_game_stats, season, weeks)
+    
+    async def collect_player_game_stats_season(
+        self, season: int, weeks: Iterable[int] = REGULAR_SEASON_WEEKS
+    ) -> List[Dict]:
+        """
+        Collect player game statistics for a whole season, fetching the weeks concurrently.
+        
+        Args:
+            season (int): The season year
+            weeks (Iterable[int], optional): Weeks to fetch, the regular season by default
+        
+        Returns:
+            List[Dict]: Player game statistics for every week, in week order
+        """
+        return await self._collect_weeks(self.collect_player_game_stats, season, weeks)
             
-            if data:
-                self.logger.info(f"Successfully collected team game stats: {len(data)} games")
-                return data
-            else:
-                self.logger.error(f"Failed to collect team game stats")
-                return []
-                
-    @sleep_and_retry
-    @limits(calls=50, period=60)
     async def collect_teams_data(self) -> List[Dict]:
         """
         Collect data for all FBS teams.
@@ -318,42 +1014,40 @@ class NCAADataCollector:
         Returns:
             List[Dict]: List of team dictionaries containing school, conference, mascot, etc.
         """
-        url = f"{self.base_endpoints['cfbd']}/teams/fbs"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['teams']
+        headers = self._cfbd_headers
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers)
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, limiter=self.cfbd_limiter,
+            ttl=self.config.cache_ttl_current
+        )
+        
+        if data:
+            # Process and structure team data
+            teams = []
+            for team in data:
+                team_dict = {
+                    'school': team.get('school'),
+                    'conference': team.get('conference'),
+                    'division': team.get('division'),
+                    'mascot': team.get('mascot'),
+                    'abbreviation': team.get('abbreviation'),
+                    'alt_name_1': team.get('alt_name_1'),
+                    'alt_name_2': team.get('alt_name_2'),
+                    'alt_name_3': team.get('alt_name_3'),
+                    'color': team.get('color'),
+                    'alt_color': team.get('alt_color'),
+                    'logos': team.get('logos', [])
+                }
+                teams.append(team_dict)
             
-            if data:
-                # Process and structure team data
-                teams = []
-                for team in data:
-                    team_dict = {
-                        'school': team.get('school'),
-                        'conference': team.get('conference'),
-                        'division': team.get('division'),
-                        'mascot': team.get('mascot'),
-                        'abbreviation': team.get('abbreviation'),
-                        'alt_name_1': team.get('alt_name_1'),
-                        'alt_name_2': team.get('alt_name_2'),
-                        'alt_name_3': team.get('alt_name_3'),
-                        'color': team.get('color'),
-                        'alt_color': team.get('alt_color'),
-                        'logos': team.get('logos', [])
-                    }
-                    teams.append(team_dict)
-                
-                self.logger.info(f"Successfully collected data for {len(teams)} teams")
-                return teams
-            else:
-                self.logger.error("Failed to collect teams data")
-                return []
+            self.logger.info(f"Successfully collected data for {len(teams)} teams")
+            return teams
+        else:
+            self.logger.error("Failed to collect teams data")
+            return []
     
-    @sleep_and_retry
-    @limits(calls=50, period=60)
-    async def collect_schedule(self, season: int) -> List[Dict]:
+    async def collect_schedule(self, season: int) -> List[GameRow]:
         """
         Collect game schedule data for a given season.
         
@@ -361,121 +1055,142 @@ class NCAADataCollector:
             season (int): The season year to collect schedule for
             
         Returns:
-            List[Dict]: List of game dictionaries with schedule information
+            List[GameRow]: List of games with schedule information
         """
-        url = f"{self.base_endpoints['cfbd']}/games"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['schedule']
+        headers = self._cfbd_headers
         params = {
             'year': season,
             'division': 'fbs'
         }
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._season_ttl(season), decode=self._decode_games
+        )
+        
+        if data:
+            # Imported here so workers that never build a schedule skip pandas' import cost
+            import pandas as pd
             
-            if data:
-                games = []
-                for game in data:
-                    # Parse start_date string to datetime object
-                    start_date = None
-                    if game.get('start_date'):
-                        try:
-                            start_date = datetime.fromisoformat(
-                                game['start_date'].replace('Z', '+00:00')
-                            )
-                        except (ValueError, AttributeError) as e:
-                            self.logger.warning(f"Could not parse date {game.get('start_date')}: {e}")
-                    
-                    game_dict = {
-                        'id': game.get('id'),
-                        'season': game.get('season'),
-                        'week': game.get('week'),
-                        'season_type': game.get('season_type'),
-                        'start_date': start_date,
-                        'home_team': game.get('home_team'),
-                        'away_team': game.get('away_team'),
-                        'home_points': game.get('home_points'),
-                        'away_points': game.get('away_points'),
-                        'venue': game.get('venue'),
-                        'venue_id': game.get('venue_id'),
-                        'neutral_site': game.get('neutral_site'),
-                        'conference_game': game.get('conference_game'),
-                        'attendance': game.get('attendance')
-                    }
-                    games.append(game_dict)
-                
-                self.logger.info(f"Successfully collected {len(games)} games for {season} season")
-                return games
+            # Column-wise over the whole season rather than a Python loop per game; object
+            # dtype keeps ints as ints where some games have no score yet
+            if msgspec is not None and isinstance(data[0], Game):
+                rows = [msgspec.structs.astuple(game) for game in data]
+                df = pd.DataFrame(rows, columns=list(SCHEDULE_FIELDS), dtype=object)
             else:
-                self.logger.error(f"Failed to collect schedule data for {season}")
-                return []
+                df = pd.DataFrame(data, dtype=object).reindex(columns=list(SCHEDULE_FIELDS))
+            raw_dates = df['start_date']
+            # An explicit ISO8601 format parses each value on its own terms; inferring one from the
+            # first row turns valid timestamps with a different precision (no ".000") into NaT
+            df['start_date'] = pd.to_datetime(raw_dates, utc=True, errors='coerce', format='ISO8601')
+            unparsed = raw_dates[df['start_date'].isna() & raw_dates.notna()]
+            if not unparsed.empty:
+                self.logger.warning(f"Could not parse {len(unparsed)} start dates, e.g. {unparsed.iloc[0]!r}")
+            for column in ('home_team', 'away_team'):
+                df[column] = df[column].map(_intern, na_action='ignore')
+            games = [
+                GameRow(*row)
+                for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            ]
+            
+            self.logger.info(f"Successfully collected {len(games)} games for {season} season")
+            return games
+        else:
+            self.logger.error(f"Failed to collect schedule data for {season}")
+            return []
     
-    @sleep_and_retry
-    @limits(calls=50, period=60)
-    async def collect_game_stats(self, game_id: int) -> Optional[Dict]:
+    async def collect_game_stats(
+        self, game_id: int, season: Optional[int] = None, completed: bool = False
+    ) -> Optional[Dict]:
         """
         Collect advanced team statistics for a specific game.
         
+        Stats are cached for good only when the game is known to be final; otherwise they
+        expire after cache_ttl_current, since an in-progress game's stats are partial.
+        
         Args:
             game_id (int): The unique identifier for the game
+            season (int, optional): The game's season; games from completed seasons are final
+            completed (bool, optional): True when the game is known to be final, e.g. its
+                schedule row has home_points/away_points
             
         Returns:
-            Optional[Dict]: Dictionary with home and away team stats, or None if failed
+            Optional[Dict]: 'game_id' plus a TeamGameStats per team, or None if failed
         """
-        url = f"{self.base_endpoints['cfbd']}/stats/game/advanced"
-        headers = {
-            'Authorization': f"Bearer {self.config.get('cfbd_api_key', '')}"
-        }
+        url = self._urls['game_stats']
+        headers = self._cfbd_headers
         params = {'gameId': game_id}
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, headers=headers, params=params)
+        data = await self._fetch_data(
+            await self._get_session(), url, headers=headers, params=params,
+            limiter=self.cfbd_limiter, ttl=self._game_ttl(season, completed)
+        )
+        
+        return self._build_game_stats(game_id, data)
+    
+    async def collect_game_stats_many(
+        self,
+        game_ids: List[int],
+        season: Optional[int] = None,
+        completed_ids: Collection[int] = ()
+    ) -> List[Optional[Dict]]:
+        """
+        Collect advanced team statistics for many games through one batched cache lookup.
+        
+        All cache keys are read in a single Redis pipeline; only the misses go to the API,
+        concurrently under the CFBD rate limiter, and are written back in a second pipeline.
+        Cache lifetimes follow collect_game_stats, per game.
+        
+        Args:
+            game_ids (List[int]): Unique identifiers of the games
+            season (int, optional): The games' season; games from completed seasons are final
+            completed_ids (Collection[int], optional): IDs of games known to be final
+            
+        Returns:
+            List[Optional[Dict]]: Game stats for each game as collect_game_stats returns them, in order
+        """
+        url = self._urls['game_stats']
+        headers = self._cfbd_headers
+        results = await self._fetch_many(
+            await self._get_session(),
+            [(url, headers, {'gameId': game_id}) for game_id in game_ids],
+            limiter=self.cfbd_limiter,
+            ttls=[self._game_ttl(season, game_id in completed_ids) for game_id in game_ids]
+        )
+        return [self._build_game_stats(game_id, data) for game_id, data in zip(game_ids, results)]
+    
+    def _build_game_stats(self, game_id: int, data: Optional[Any]) -> Optional[Dict]:
+        """Turn a /stats/game/advanced response into the game stats dict, or None if it's unusable."""
+        if data and isinstance(data, list) and len(data) >= 2:
+            # Process the two team stats into a structured format; home/away names are
+            # recovered by joining on game_id against the schedule rather than copied here
+            game_stats = {'game_id': game_id}
             
-            if data and isinstance(data, list) and len(data) >= 2:
-                # Process the two team stats into a structured format
-                game_stats = {}
+            for team_stats in data:
+                team_name = team_stats.get('team')
+                if not team_name:
+                    continue
                 
-                for team_stats in data:
-                    team_name = team_stats.get('team')
-                    if not team_name:
-                        continue
-                    
-                    # Extract key statistics
-                    stats = team_stats.get('stats', {})
-                    processed_stats = {
-                        'team': team_name,
-                        'totalYards': stats.get('totalYards'),
-                        'netPassingYards': stats.get('netPassingYards'),
-                        'rushingYards': stats.get('rushingYards'),
-                        'turnovers': stats.get('turnovers'),
-                        'thirdDownEff': stats.get('thirdDownEff'),
-                        'sacks': stats.get('sacks'),
-                        'tacklesForLoss': stats.get('tacklesForLoss'),
-                        'passCompletionPercentage': stats.get('passCompletionPercentage'),
-                        'timeOfPossession': stats.get('timeOfPossession'),
-                        'firstDowns': stats.get('firstDowns'),
-                        'fourthDownEff': stats.get('fourthDownEff'),
-                        'penalties': stats.get('penalties'),
-                        'penaltyYards': stats.get('penaltyYards')
-                    }
-                    
-                    # Determine if this is home or away team (simplified approach)
-                    if not game_stats:
-                        game_stats['team_1'] = processed_stats
-                    else:
-                        game_stats['team_2'] = processed_stats
+                # Extract key statistics
+                stats = team_stats.get('stats', {})
+                processed_stats = TeamGameStats(
+                    team_name, *(stats.get(field) for field in TEAM_GAME_STAT_FIELDS)
+                )
                 
-                self.logger.info(f"Successfully collected game stats for game {game_id}")
-                return game_stats
-            else:
-                self.logger.error(f"Failed to collect game stats for game {game_id}")
-                return None
+                # Determine if this is home or away team (simplified approach)
+                if 'team_1' not in game_stats:
+                    game_stats['team_1'] = processed_stats
+                else:
+                    game_stats['team_2'] = processed_stats
+            
+            self.logger.info(f"Successfully collected game stats for game {game_id}")
+            return game_stats
+        else:
+            self.logger.error(f"Failed to collect game stats for game {game_id}")
+            return None
     
-    @sleep_and_retry
-    @limits(calls=450, period=3600)
-    async def collect_betting_lines(self, season: int) -> List[Dict]:
+    async def collect_betting_lines(self, season: int) -> List[BettingLine]:
         """
         Collect betting odds and lines for NCAA football games.
         
@@ -483,81 +1198,77 @@ class NCAADataCollector:
             season (int): The season year to collect betting data for
             
         Returns:
-            List[Dict]: List of betting line dictionaries from various bookmakers
+            List[BettingLine]: Betting lines from various bookmakers
         """
-        url = f"{self.base_endpoints['odds']}/sports/americanfootball_ncaaf/odds"
+        if not self.config.odds_api_key:
+            self.logger.warning("Skipping betting lines: ODDS_API_KEY is not set")
+            return []
+        
+        url = self._urls['betting_lines']
         params = {
-            'apiKey': self.config.get('odds_api_key', ''),
+            'apiKey': self.config.odds_api_key,
             'regions': 'us',
             'markets': 'spreads,totals',
             'oddsFormat': 'american',
             'dateFormat': 'iso'
         }
         
-        async with aiohttp.ClientSession() as session:
-            data = await self._fetch_data(session, url, params=params)
+        data = await self._fetch_data(
+            await self._get_session(), url, params=params, limiter=self.odds_limiter
+        )
+        
+        if data and isinstance(data, list):
+            betting_lines = []
             
-            if data and isinstance(data, list):
-                betting_lines = []
+            for game in data:
+                home_team = _intern(game.get('home_team'))
+                away_team = _intern(game.get('away_team'))
+                commence_time = game.get('commence_time')
+                
+                # Parse commence time
+                game_time = None
+                if commence_time:
+                    try:
+                        game_time = _parse_iso(commence_time)
+                    except (ValueError, TypeError, AttributeError) as e:
+                        self.logger.warning(f"Could not parse game time {commence_time}: {e}")
                 
-                for game in data:
-                    home_team = game.get('home_team')
-                    away_team = game.get('away_team')
-                    commence_time = game.get('commence_time')
+                # Process each bookmaker
+                for bookmaker in game.get('bookmakers', []):
+                    bookmaker_name = bookmaker.get('key')
                     
-                    # Parse commence time
-                    game_time = None
-                    if commence_time:
-                        try:
-                            game_time = datetime.fromisoformat(
-                                commence_time.replace('Z', '+00:00')
-                            )
-                        except (ValueError, AttributeError) as e:
-                            self.logger.warning(f"Could not parse game time {commence_time}: {e}")
+                    line_data = BettingLine(home_team, away_team, game_time, bookmaker_name)
                     
-                    # Process each bookmaker
-                    for bookmaker in game.get('bookmakers', []):
-                        bookmaker_name = bookmaker.get('key')
-                        
-                        line_data = {
-                            'home_team': home_team,
-                            'away_team': away_team,
-                            'commence_time': game_time,
-                            'bookmaker': bookmaker_name,
-                            'spread_point': None,
-                            'spread_home_price': None,
-                            'spread_away_price': None,
-                            'total_point': None,
-                            'total_over_price': None,
-                            'total_under_price': None
-                        }
+                    # Extract spreads and totals from markets, indexing each market's outcomes
+                    # by name once instead of comparing every outcome against each side
+                    for market in bookmaker.get('markets', []):
+                        market_key = market.get('key')
+                        if market_key not in ('spreads', 'totals'):
+                            continue
+                        by_name = {outcome.get('name'): outcome for outcome in market.get('outcomes', [])}
                         
-                        # Extract spreads and totals from markets
-                        for market in bookmaker.get('markets', []):
-                            market_key = market.get('key')
-                            
-                            if market_key == 'spreads':
-                                outcomes = market.get('outcomes', [])
-                                for outcome in outcomes:
-                                    if outcome.get('name') == home_team:
-                                        line_data['spread_point'] = outcome.get('point')
-                                        line_data['spread_home_price'] = outcome.get('price')
-                                    elif outcome.get('name') == away_team:
-                                        line_data['spread_away_price'] = outcome.get('price')
-                            
-                            elif market_key == 'totals':
-                                outcomes = market.get('outcomes', [])
-                                for outcome in outcomes:
-                                    if outcome.get('name') == 'Over':
-                                        line_data['total_point'] = outcome.get('point')
-                                        line_data['total_over_price'] = outcome.get('price')
-                                    elif outcome.get('name') == 'Under':
-                                        line_data['total_under_price'] = outcome.get('price')
+                        if market_key == 'spreads':
+                            home = by_name.get(home_team)
+                            if home is not None:
+                                line_data.spread_point = home.get('point')
+                                line_data.spread_home_price = home.get('price')
+                            away = by_name.get(away_team)
+                            if away is not None:
+                                line_data.spread_away_price = away.get('price')
                         
-                        betting_lines.append(line_data)
-                
-                self.logger.info(f"Successfully collected {len(betting_lines)} betting lines")
-                return betting_lines
-            else:
-                self.logger.error("Failed to collect betting lines data")
-                return []
\ No newline at end of file
+                        else:
+                            over = by_name.get('Over')
+                            if over is not None:
+                                line_data.total_point = over.get('point')
+                                line_data.total_over_price = over.get('price')
+                            under = by_name.get('Under')
+                            if under is not None:
+                                line_data.total_under_price = under.get('price')
+                    
+                    betting_lines.append(line_data)
+            
+            self.logger.info(f"Successfully collected {len(betting_lines)} betting lines")
+            return betting_lines
+        else:
+            self.logger.error("Failed to collect betting lines data")
+            return []
\ No newline at end of file
@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from src.data_pipeline.collectors import GameRow
+
+
+def _matchup(game: Union['GameRow', Dict[str, Any]]) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Read (id, home_team, away_team) from a GameRow or a schedule dict read back from disk."""
+    if isinstance(game, dict):
+        return game.get('id'), game.get('home_team'), game.get('away_team')
+    return game.id, game.home_team, game.away_team
+
+
+def join_stats_with_schedule(stats: List[Dict], schedule: List[Union['GameRow', Dict]]) -> List[Dict]:
+    """
+    Attach home/away team names from the schedule to per-game stats records.
+    
+    Game stats are saved with only a ``game_id`` link, so the matchup is recovered
+    here instead of being duplicated into every stats record on disk.
+    
+    Args:
+        stats (List[Dict]): Game stats records carrying a 'game_id'
+        schedule (List[Union[GameRow, Dict]]): Schedule rows from collect_schedule, or the
+            dicts of a saved (or resumed) schedule file
+        
+    Returns:
+        List[Dict]: New stats records with 'home_team' and 'away_team' filled in
+    """
+    matchups = {game_id: (home_team, away_team) for game_id, home_team, away_team in map(_matchup, schedule)}
+    
+    joined = []
+    for record in stats:
+        home_team, away_team = matchups.get(record.get('game_id'), (None, None))
+        joined.append({**record, 'home_team': home_team, 'away_team': away_team})
+    
+    return joined